@@ -0,0 +1,263 @@
+"""
+Axis Toggle Widget
+===================
+Compact per-axis record/lock grid for the sidebar. One painted widget
+replaces a checkbox plus a lock button per axis: state is two bitmasks
+(bit i = row i) and clicks are hit-tested against the row layout.
+"""
+
+from PyQt6.QtWidgets import QWidget, QSizePolicy, QToolTip
+from PyQt6.QtCore import Qt, QEvent, QRectF, QSize, pyqtSignal
+from PyQt6.QtGui import QPainter, QPen, QColor, QBrush, QFont, QPixmap
+
+
+class AxisMultiToggle(QWidget):
+    """
+    Six (or any number of) axis rows, each with a record checkbox and a
+    lock toggle. The rows are painted into a pixmap that is reused until a
+    bit, the hover or focus target or the widget size changes. Arrow keys
+    move the focused cell and Space/Enter toggles it.
+    """
+
+    # (record_mask, lock_mask) after any user change
+    mask_changed = pyqtSignal(int, int)
+
+    ROW_HEIGHT = 22
+    ROW_SPACING = 3
+    BOX_SIZE = 16
+    LOCK_SIZE = 22
+
+    # Colors (match the dark.qss checkbox and the old lock button styles)
+    COLOR_BOX = QColor(49, 50, 68)
+    COLOR_BOX_BORDER = QColor(69, 71, 90)
+    COLOR_CHECKED = QColor(137, 180, 250)
+    COLOR_TEXT = QColor(205, 214, 244)
+    COLOR_LOCK = QColor(49, 50, 68)
+    COLOR_LOCK_HOVER = QColor(69, 71, 90)
+    COLOR_LOCKED = QColor(243, 139, 168)
+    COLOR_LOCK_GLYPH = QColor(166, 173, 200)
+    COLOR_LOCKED_GLYPH = QColor(30, 30, 46)
+    COLOR_FOCUS = QColor(180, 190, 254)
+
+    LOCK_GLYPHS = ("\U0001F513", "\U0001F512")  # unlocked, locked
+
+    def __init__(self, axes, record_mask: int = 1, parent=None):
+        """axes: sequence of (name, short label, description) per row."""
+        super().__init__(parent)
+        self._axes = tuple(axes)
+        self._record_mask = record_mask
+        self._lock_mask = 0
+        self._hover = None  # (row, is_lock) under the mouse
+        self._focus = (0, False)  # (row, is_lock) driven by the keyboard
+        self._pixmap = None
+        self._pixmap_key = None
+        self._glyph_font = QFont()
+        self._glyph_font.setPixelSize(12)
+        self.setMouseTracking(True)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        self.setFixedHeight(self.sizeHint().height())
+
+    # ---- State ----
+
+    def axis_names(self) -> list[str]:
+        return [name for name, _, _ in self._axes]
+
+    def record_mask(self) -> int:
+        return self._record_mask
+
+    def lock_mask(self) -> int:
+        return self._lock_mask
+
+    def set_record_mask(self, mask: int):
+        """Set the record bits without emitting mask_changed."""
+        self._record_mask = mask & ((1 << len(self._axes)) - 1)
+        self.update()
+
+    def _flip(self, row: int, is_lock: bool):
+        if is_lock:
+            self._lock_mask ^= 1 << row
+        else:
+            self._record_mask ^= 1 << row
+        self.update()
+        self.mask_changed.emit(self._record_mask, self._lock_mask)
+
+    # ---- Layout ----
+
+    def sizeHint(self) -> QSize:
+        n = len(self._axes)
+        return QSize(140, n * self.ROW_HEIGHT + max(0, n - 1) * self.ROW_SPACING)
+
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+
+    def _row_at(self, y: float):
+        pitch = self.ROW_HEIGHT + self.ROW_SPACING
+        row = int(y // pitch)
+        if 0 <= row < len(self._axes) and y - row * pitch < self.ROW_HEIGHT:
+            return row
+        return None
+
+    def _hit(self, pos):
+        """(row, is_lock) under a widget position, or None."""
+        row = self._row_at(pos.y())
+        if row is None:
+            return None
+        return row, pos.x() >= self.width() - self.LOCK_SIZE
+
+    # ---- Events ----
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            hit = self._hit(event.position())
+            if hit is not None:
+                self._focus = hit
+                self._flip(*hit)
+                return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        hit = self._hit(event.position())
+        if hit != self._hover:
+            self._hover = hit
+            self.setCursor(Qt.CursorShape.PointingHandCursor if hit
+                           else Qt.CursorShape.ArrowCursor)
+            self.update()
+        super().mouseMoveEvent(event)
+
+    def keyPressEvent(self, event):
+        row, is_lock = self._focus
+        key = event.key()
+        if key == Qt.Key.Key_Up:
+            row = max(0, row - 1)
+        elif key == Qt.Key.Key_Down:
+            row = min(len(self._axes) - 1, row + 1)
+        elif key == Qt.Key.Key_Left:
+            is_lock = False
+        elif key == Qt.Key.Key_Right:
+            is_lock = True
+        elif key in (Qt.Key.Key_Space, Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            self._flip(row, is_lock)
+            return
+        else:
+            super().keyPressEvent(event)
+            return
+        if (row, is_lock) != self._focus:
+            self._focus = (row, is_lock)
+            self.update()
+
+    def focusInEvent(self, event):
+        self.update()
+        super().focusInEvent(event)
+
+    def focusOutEvent(self, event):
+        self.update()
+        super().focusOutEvent(event)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.FontChange:
+            self._pixmap = None  # labels must be re-laid out
+        super().changeEvent(event)
+
+    def leaveEvent(self, event):
+        if self._hover is not None:
+            self._hover = None
+            self.update()
+        super().leaveEvent(event)
+
+    def event(self, event):
+        if event.type() == QEvent.Type.ToolTip:
+            hit = self._hit(event.pos())
+            if hit is None:
+                QToolTip.hideText()
+            else:
+                row, is_lock = hit
+                _, short_label, desc = self._axes[row]
+                if not is_lock:
+                    text = f"Record {desc} axis"
+                elif self._lock_mask >> row & 1:
+                    text = f"Unlock {short_label} axis"
+                else:
+                    text = f"Lock {short_label} axis"
+                QToolTip.showText(event.globalPos(), text, self)
+            return True
+        return super().event(event)
+
+    # ---- Painting ----
+
+    def paintEvent(self, event):
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr,
+               self._record_mask, self._lock_mask, self._hover,
+               self._focus if self.hasFocus() else None)
+        if self._pixmap is None or self._pixmap_key != key:
+            self._pixmap = self._render(dpr)
+            self._pixmap_key = key
+        with QPainter(self) as p:
+            p.drawPixmap(0, 0, self._pixmap)
+
+    def _render(self, dpr: float) -> QPixmap:
+        w = self.width()
+        focus = self._focus if self.hasFocus() else None
+        pixmap = QPixmap(round(w * dpr), round(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        pitch = self.ROW_HEIGHT + self.ROW_SPACING
+        box = self.BOX_SIZE
+        lock = self.LOCK_SIZE
+        align_left = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        font = self.font()
+        with QPainter(pixmap) as p:
+            for row, (_, short_label, _) in enumerate(self._axes):
+                top = row * pitch
+                recording = self._record_mask >> row & 1
+                locked = self._lock_mask >> row & 1
+
+                # Record checkbox
+                box_rect = QRectF(0.5, top + (self.ROW_HEIGHT - box) / 2 + 0.5,
+                                  box - 1, box - 1)
+                fill = self.COLOR_CHECKED if recording else self.COLOR_BOX
+                border = self.COLOR_CHECKED if recording else self.COLOR_BOX_BORDER
+                p.setRenderHint(QPainter.RenderHint.Antialiasing)
+                p.setPen(QPen(border, 1))
+                p.setBrush(QBrush(fill))
+                p.drawRoundedRect(box_rect, 3, 3)
+                p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+
+                # Label
+                p.setFont(font)
+                p.setPen(self.COLOR_TEXT)
+                p.drawText(QRectF(box + 6, top, w - box - 6 - lock - 4, self.ROW_HEIGHT),
+                           align_left, short_label)
+
+                # Lock toggle
+                lock_rect = QRectF(w - lock, top, lock, self.ROW_HEIGHT)
+                if locked:
+                    bg = self.COLOR_LOCKED
+                elif self._hover == (row, True):
+                    bg = self.COLOR_LOCK_HOVER
+                else:
+                    bg = self.COLOR_LOCK
+                p.setRenderHint(QPainter.RenderHint.Antialiasing)
+                p.setPen(Qt.PenStyle.NoPen)
+                p.setBrush(QBrush(bg))
+                p.drawRoundedRect(lock_rect, 3, 3)
+                p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+                p.setFont(self._glyph_font)
+                p.setPen(self.COLOR_LOCKED_GLYPH if locked else self.COLOR_LOCK_GLYPH)
+                p.drawText(lock_rect, Qt.AlignmentFlag.AlignCenter,
+                           self.LOCK_GLYPHS[locked])
+
+                # Keyboard focus ring around the focused cell
+                if focus is not None and focus[0] == row:
+                    if focus[1]:
+                        ring = lock_rect.adjusted(0.5, 0.5, -0.5, -0.5)
+                    else:
+                        ring = box_rect.adjusted(-1, -1, 1, 1)
+                    p.setRenderHint(QPainter.RenderHint.Antialiasing)
+                    p.setPen(QPen(self.COLOR_FOCUS, 1))
+                    p.setBrush(Qt.BrushStyle.NoBrush)
+                    p.drawRoundedRect(ring, 3, 3)
+                    p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        return pixmap
@@ -43,6 +43,7 @@ pyinstaller --noconfirm ^
     --paths . ^
     --additional-hooks-dir hooks ^
     --hidden-import main_window ^
+    --hidden-import axis_toggle ^
     --hidden-import video_player ^
     --hidden-import vr_controller ^
     --hidden-import recorder ^
@@ -65,6 +66,7 @@ pyinstaller --noconfirm ^
     --hidden-import PyQt6.QtGui ^
     --hidden-import PyQt6.sip ^
     --collect-all openvr ^
+    --add-data "dark.qss;." ^
     main.py
 
 if errorlevel 1 (
@@ -9,11 +9,16 @@ Emits calibration_finished(dict) with {axis_name: {"min": float, "max": float}}
 for every axis the user confirmed.
 """
 
+import time
+from collections import deque
+from operator import attrgetter
+from typing import Callable, NamedTuple, Optional
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QProgressBar, QFrame
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QRectF
+from PyQt6.QtCore import Qt, QTimer, QThread, QCoreApplication, pyqtSignal, QLine, QRectF
 from PyQt6.QtGui import QPainter, QPen, QColor, QBrush, QFont
 
 
@@ -41,6 +46,97 @@ CALIBRATION_STEPS = [
 
 TOTAL_STEPS = len(CALIBRATION_STEPS)
 
+_ROTATION_AXES = ("pitch", "yaw", "roll")
+
+# Paint resources shared across frames (GUI thread only)
+_BG_COLOR = QColor(24, 24, 37, 240)
+_BORDER_PEN = QPen(QColor(69, 71, 90), 2)
+_GAUGE_TRACK_BRUSH = QBrush(QColor(49, 50, 68))
+_GAUGE_GRID_PEN = QPen(QColor(69, 71, 90), 1, Qt.PenStyle.DashLine)
+_GAUGE_DOT_BRUSH = QBrush(QColor(255, 255, 255, 200))
+
+
+class _Step(NamedTuple):
+    """Precomputed view of a CALIBRATION_STEPS entry used on the hot path."""
+    axis: str
+    endpoint: str
+    label: str
+    instruction: str
+    hint: str
+    color: QColor
+    getter: Callable      # ControllerState -> raw axis value
+    bias: float           # Gauge normalisation: (val - bias) * scale
+    scale: float
+
+
+_STEPS = tuple(
+    _Step(
+        axis=s["axis"], endpoint=s["endpoint"], label=s["label"],
+        instruction=s["instruction"], hint=s["hint"], color=s["color"],
+        getter=attrgetter(s["axis"]),
+        bias=-180.0 if s["axis"] in _ROTATION_AXES else -1.5,
+        scale=1 / 360.0 if s["axis"] in _ROTATION_AXES else 1 / 3.0,
+    )
+    for s in CALIBRATION_STEPS
+)
+
+
+class _ControllerSampler(QThread):
+    """
+    Samples the controller on a monotonic deadline off the GUI thread.
+
+    Each tick appends (timestamp_ns, ControllerState) to a bounded deque so
+    capture reads the freshest pose regardless of GUI load; every Nth sample
+    emits sample_ready (queued) for the live display.
+    """
+
+    sample_ready = pyqtSignal()
+
+    def __init__(self, controller, interval_ms: float = 4.0, emit_every: int = 4,
+                 parent=None):
+        super().__init__(parent)
+        self._controller = controller
+        self._interval_ns = int(interval_ms * 1_000_000)
+        self._emit_every = emit_every
+        self.samples: deque = deque(maxlen=256)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+
+    def latest(self):
+        """Most recent ControllerState, or None before the first tick."""
+        try:
+            return self.samples[-1][1]
+        except IndexError:
+            return None
+
+    def stop(self):
+        if self.isRunning():
+            self.requestInterruption()
+            self.wait()
+
+    def run(self):
+        get_state = self._controller.get_current_state
+        append = self.samples.append
+        emit = self.sample_ready.emit
+        interval = self._interval_ns
+        emit_every = self._emit_every
+        clock = time.perf_counter_ns
+        count = 0
+        deadline = clock()
+        while not self.isInterruptionRequested():
+            append((clock(), get_state()))
+            count += 1
+            if count % emit_every == 0:
+                emit()
+            deadline += interval
+            delay = deadline - clock()
+            if delay > 0:
+                time.sleep(delay / 1e9)
+            else:
+                # Fell behind (e.g. GIL contention): resync rather than burst
+                deadline = clock()
+
 
 class CalibrationWizard(QWidget):
     """
@@ -55,9 +151,11 @@ class CalibrationWizard(QWidget):
         super().__init__(parent)
         self._controller = controller
         self._step_index = 0
-        self._results: dict = {}
+        self._results: dict = {}            # {(axis, endpoint): raw value}
         self._skipped_axes: set = set()
         self._raw_value: float = 0.0
+        self._last_value_text = ""
+        self._last_norm: Optional[float] = None
 
         # Make this a frameless tool window so it floats above all child widgets
         # (including native video surfaces like mpv)
@@ -69,10 +167,11 @@ class CalibrationWizard(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating, False)
         self.setAutoFillBackground(True)
 
-        # Live value polling
-        self._poll_timer = QTimer(self)
-        self._poll_timer.setInterval(33)
-        self._poll_timer.timeout.connect(self._poll_value)
+        # Live value sampling: a 250 Hz sampler thread feeds capture, and
+        # every 4th sample (~60 Hz) refreshes the labels/gauge
+        self._sampler = _ControllerSampler(controller, parent=self)
+        self._sampler.sample_ready.connect(
+            self._refresh_live_display, Qt.ConnectionType.QueuedConnection)
 
         self._build_ui()
 
@@ -217,7 +316,8 @@ class CalibrationWizard(QWidget):
         self._results = {}
         self._skipped_axes = set()
         self._update_step_display()
-        self._poll_timer.start()
+        self._sampler.samples.clear()
+        self._sampler.start()
 
         # Position over the parent window's central area
         if self.parent():
@@ -243,54 +343,48 @@ class CalibrationWizard(QWidget):
     # ---- Internals ----
 
     def _get_raw_value_for_step(self) -> float:
-        state = self._controller.get_current_state()
-        step = CALIBRATION_STEPS[self._step_index]
-        axis = step["axis"]
-        raw_map = {
-            "x": state.x, "y": state.y, "z": state.z,
-            "pitch": state.pitch, "yaw": state.yaw, "roll": state.roll,
-        }
-        return raw_map.get(axis, 0.0)
+        state = self._sampler.latest()
+        if state is None:
+            state = self._controller.get_current_state()
+        return _STEPS[self._step_index].getter(state)
 
-    def _poll_value(self):
+    def _refresh_live_display(self):
+        """Push the latest sampled value to the label and gauge (UI rate)."""
         if not self.isVisible() or self._step_index >= TOTAL_STEPS:
             return
-        val = self._get_raw_value_for_step()
-        self._raw_value = val
-        self._value_label.setText(f"Current value: {val:.4f}")
-
-        step = CALIBRATION_STEPS[self._step_index]
-        axis = step["axis"]
-        if axis in ("pitch", "yaw", "roll"):
-            norm = max(0.0, min(1.0, (val + 180) / 360))
-        else:
-            norm = max(0.0, min(1.0, (val + 1.5) / 3.0))
-        self._gauge.set_value(norm, step["color"])
-
-        # Update captured summary
-        self._update_captured_summary()
+        val = self._raw_value = self._get_raw_value_for_step()
+
+        text = f"Current value: {val:.4f}"
+        if text != self._last_value_text:
+            self._last_value_text = text
+            self._value_label.setText(text)
+
+        step = _STEPS[self._step_index]
+        norm = max(0.0, min(1.0, (val - step.bias) * step.scale))
+        # Only repaint the gauge for at least a one-pixel change
+        if self._last_norm is None or abs(norm - self._last_norm) > 1 / 220:
+            self._last_norm = norm
+            self._gauge.set_value(norm, step.color)
 
     def _update_captured_summary(self):
-        step = CALIBRATION_STEPS[self._step_index]
-        axis = step["axis"]
-        if axis in self._results:
-            vals = self._results[axis]
-            parts = []
-            if "min" in vals:
-                parts.append(f"min: {vals['min']:.4f}")
-            if "max" in vals:
-                parts.append(f"max: {vals['max']:.4f}")
-            self._captured_label.setText(f"Captured: {', '.join(parts)}")
-        else:
-            self._captured_label.setText("")
+        """Refresh the captured-values line; called when results or step change."""
+        axis = _STEPS[self._step_index].axis
+        lo = self._results.get((axis, "min"))
+        hi = self._results.get((axis, "max"))
+        parts = []
+        if lo is not None:
+            parts.append(f"min: {lo:.4f}")
+        if hi is not None:
+            parts.append(f"max: {hi:.4f}")
+        self._captured_label.setText(f"Captured: {', '.join(parts)}" if parts else "")
 
     def _update_step_display(self):
         if self._step_index >= TOTAL_STEPS:
             self._finish()
             return
 
-        step = CALIBRATION_STEPS[self._step_index]
-        axis = step["axis"]
+        step = _STEPS[self._step_index]
+        axis = step.axis
 
         # Auto-skip if this axis was skipped
         if axis in self._skipped_axes:
@@ -298,29 +392,29 @@ class CalibrationWizard(QWidget):
             self._update_step_display()
             return
 
-        color_hex = step["color"].name()
+        color_hex = step.color.name()
         self._step_counter.setText(f"Step {self._step_index + 1} / {TOTAL_STEPS}")
         self._progress.setValue(self._step_index)
-        self._axis_label.setText(step["label"])
+        self._axis_label.setText(step.label)
         self._axis_label.setStyleSheet(f"color: {color_hex};")
-        self._instruction.setText(step["instruction"])
-        self._hint_label.setText(step["hint"])
+        self._instruction.setText(step.instruction)
+        self._hint_label.setText(step.hint)
         self._hint_label.setStyleSheet(f"color: {color_hex};")
-        self._captured_label.setText("")
+        self._update_captured_summary()
         self._back_btn.setEnabled(self._step_index > 0)
+        self._last_norm = None  # New step colour: force a gauge repaint
 
     def _confirm_step(self):
         if self._step_index >= TOTAL_STEPS:
             return
 
-        step = CALIBRATION_STEPS[self._step_index]
-        axis = step["axis"]
-        endpoint = step["endpoint"]
+        step = _STEPS[self._step_index]
+        axis = step.axis
+        endpoint = step.endpoint
         val = self._get_raw_value_for_step()
 
-        if axis not in self._results:
-            self._results[axis] = {}
-        self._results[axis][endpoint] = val
+        self._results[(axis, endpoint)] = val
+        self._update_captured_summary()
 
         # Flash
         self._confirm_btn.setText("✓  Captured!")
@@ -344,17 +438,12 @@ class CalibrationWizard(QWidget):
         self._step_index -= 1
 
         # If the previous step's axis was skipped, un-skip it
-        step = CALIBRATION_STEPS[self._step_index]
-        axis = step["axis"]
+        step = _STEPS[self._step_index]
+        axis = step.axis
         self._skipped_axes.discard(axis)
 
         # Clear the captured endpoint so the user can redo it
-        endpoint = step["endpoint"]
-        if axis in self._results and endpoint in self._results[axis]:
-            del self._results[axis][endpoint]
-            # If both endpoints are gone, remove the axis entry entirely
-            if not self._results[axis]:
-                del self._results[axis]
+        self._results.pop((axis, step.endpoint), None)
 
         self._confirm_btn.setText("Confirm  ✓")
         self._confirm_btn.setStyleSheet(self._btn_style_primary)
@@ -363,31 +452,34 @@ class CalibrationWizard(QWidget):
     def _skip_axis(self):
         if self._step_index >= TOTAL_STEPS:
             return
-        step = CALIBRATION_STEPS[self._step_index]
-        axis = step["axis"]
+        step = _STEPS[self._step_index]
+        axis = step.axis
         self._skipped_axes.add(axis)
-        if axis in self._results:
-            del self._results[axis]
+        self._results.pop((axis, "min"), None)
+        self._results.pop((axis, "max"), None)
         # Advance past both steps for this axis
         while (self._step_index < TOTAL_STEPS and
-               CALIBRATION_STEPS[self._step_index]["axis"] == axis):
+               _STEPS[self._step_index].axis == axis):
             self._step_index += 1
         self._confirm_btn.setText("Confirm  ✓")
         self._confirm_btn.setStyleSheet(self._btn_style_primary)
         self._update_step_display()
 
     def _finish(self):
-        self._poll_timer.stop()
+        self._sampler.stop()
         self._progress.setValue(TOTAL_STEPS)
         self.hide()
-        valid = {}
-        for axis, vals in self._results.items():
-            if "min" in vals and "max" in vals and vals["min"] != vals["max"]:
-                valid[axis] = vals
+        grouped = {}
+        for (axis, endpoint), val in self._results.items():
+            grouped.setdefault(axis, {})[endpoint] = val
+        valid = {
+            axis: vals for axis, vals in grouped.items()
+            if len(vals) == 2 and vals["min"] != vals["max"]
+        }
         self.calibration_finished.emit(valid)
 
     def _cancel(self):
-        self._poll_timer.stop()
+        self._sampler.stop()
         self.hide()
         self.calibration_cancelled.emit()
 
@@ -395,9 +487,10 @@ class CalibrationWizard(QWidget):
 
     def paintEvent(self, event):
         p = QPainter(self)
+        # Flat axis-aligned fill: no AA needed; only the rounded border uses it
+        p.fillRect(self.rect(), _BG_COLOR)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        p.fillRect(self.rect(), QColor(24, 24, 37, 240))
-        p.setPen(QPen(QColor(69, 71, 90), 2))
+        p.setPen(_BORDER_PEN)
         p.setBrush(Qt.BrushStyle.NoBrush)
         p.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 12, 12)
         p.end()
@@ -409,13 +502,35 @@ class _CalibrationGauge(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._value = 0.5
-        self._color = QColor(137, 180, 250)
+        self._pixel = self._value_to_pixel(self._value)
+        self._set_color(QColor(137, 180, 250))
+
+    def _value_to_pixel(self, value: float) -> int:
+        """Fill height in whole pixels for a normalised value."""
+        return int(value * (self.height() - 20))
+
+    def _set_color(self, color: QColor):
+        self._color = color
+        fill = QColor(color)
+        fill.setAlpha(60)
+        self._fill_brush = QBrush(fill)
+        self._indicator_pen = QPen(color, 3)
+        self._dot_brush = QBrush(color)
 
     def set_value(self, normalized: float, color: QColor):
         self._value = max(0.0, min(1.0, normalized))
-        self._color = color
+        pixel = self._value_to_pixel(self._value)
+        if pixel == self._pixel and color is self._color:
+            return  # Same pixel, same colour: nothing to repaint
+        self._pixel = pixel
+        if color is not self._color:
+            self._set_color(color)
         self.update()
 
+    def resizeEvent(self, event):
+        self._pixel = self._value_to_pixel(self._value)
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
         p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -428,33 +543,34 @@ class _CalibrationGauge(QWidget):
 
         # Track
         p.setPen(Qt.PenStyle.NoPen)
-        p.setBrush(QColor(49, 50, 68))
+        p.setBrush(_GAUGE_TRACK_BRUSH)
         p.drawRoundedRect(bar_x, bar_y, bar_w, bar_h, 6, 6)
 
-        # Grid
-        p.setPen(QPen(QColor(69, 71, 90), 1, Qt.PenStyle.DashLine))
-        for frac in [0.0, 0.25, 0.5, 0.75, 1.0]:
-            y = bar_y + bar_h - frac * bar_h
-            p.drawLine(bar_x + 2, int(y), bar_x + bar_w - 2, int(y))
+        # Grid (axis-aligned, whole-pixel lines: drawn without AA)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        p.setPen(_GAUGE_GRID_PEN)
+        grid = []
+        for frac in (0.0, 0.25, 0.5, 0.75, 1.0):
+            y = int(bar_y + bar_h - frac * bar_h)
+            grid.append(QLine(bar_x + 2, y, bar_x + bar_w - 2, y))
+        p.drawLines(grid)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Fill
-        val_y = bar_y + bar_h - self._value * bar_h
-        fill_color = QColor(self._color)
-        fill_color.setAlpha(60)
+        val_y = bar_y + bar_h - self._pixel
         p.setPen(Qt.PenStyle.NoPen)
-        p.setBrush(fill_color)
-        fill_h = bar_y + bar_h - val_y
-        p.drawRoundedRect(bar_x, int(val_y), bar_w, int(fill_h), 4, 4)
+        p.setBrush(self._fill_brush)
+        p.drawRoundedRect(bar_x, val_y, bar_w, self._pixel, 4, 4)
 
         # Indicator line
-        p.setPen(QPen(self._color, 3))
-        p.drawLine(bar_x - 4, int(val_y), bar_x + bar_w + 4, int(val_y))
+        p.setPen(self._indicator_pen)
+        p.drawLine(bar_x - 4, val_y, bar_x + bar_w + 4, val_y)
 
         # Dot
         p.setPen(Qt.PenStyle.NoPen)
-        p.setBrush(QBrush(self._color))
-        p.drawEllipse(int(w / 2 - 8), int(val_y - 8), 16, 16)
-        p.setBrush(QColor(255, 255, 255, 200))
-        p.drawEllipse(int(w / 2 - 4), int(val_y - 4), 8, 8)
+        p.setBrush(self._dot_brush)
+        p.drawEllipse(int(w / 2 - 8), val_y - 8, 16, 16)
+        p.setBrush(_GAUGE_DOT_BRUSH)
+        p.drawEllipse(int(w / 2 - 4), val_y - 4, 8, 8)
 
         p.end()
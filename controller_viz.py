@@ -12,15 +12,24 @@ Includes Calibration (Ctrl+R) to recenter the view.
 NOTE: Uses a shared global state for calibration so all views stay in sync.
 """
 
+import functools
 import math
+from collections import OrderedDict
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QSlider, QFrame, QSizePolicy, QSizeGrip
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QPoint, QSize, QRectF, QObject
+from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QLineF, QPoint, QSize, QRectF, QObject, QTimer
 from PyQt6.QtGui import (
-    QPainter, QPen, QColor, QBrush, QFont, QPainterPath,
-    QMouseEvent, QLinearGradient
+    QPainter, QPen, QColor, QBrush, QFont, QPolygonF, QPixmap,
+    QMouseEvent, QLinearGradient, QStaticText
 )
 
 
@@ -39,9 +48,17 @@ class _VizSharedState(QObject):
         super().__init__()
         # Offsets (Pitch, Yaw, Roll)
         self.offsets = (0.0, 0.0, 0.0)
+        self._pending = False
 
     def set_offsets(self, p, y, r):
         self.offsets = (p, y, r)
+        # Coalesce bursts of updates into one emit per event-loop pass
+        if not self._pending:
+            self._pending = True
+            QTimer.singleShot(0, self._emit_changed)
+
+    def _emit_changed(self):
+        self._pending = False
         self.state_changed.emit()
 
     def get_offsets(self):
@@ -55,24 +72,77 @@ _SHARED_STATE = _VizSharedState()
 # 3D math helpers
 # ============================================================
 
-def _rot_x(pts, angle_deg):
-    """Rotate list of (x,y,z) around X axis."""
-    a = math.radians(angle_deg)
-    ca, sa = math.cos(a), math.sin(a)
-    return [(x, y * ca - z * sa, y * sa + z * ca) for x, y, z in pts]
+# Scalar fallback for when NumPy is unavailable.  math functions are bound
+# as default arguments (local lookups), and the per-vertex stages return
+# generators so a chain only materialises once, in _project().
+
+def _rot_x(pts, angle_deg, _rad=math.radians, _cos=math.cos, _sin=math.sin):
+    """Rotate (x,y,z) points around the X axis (lazily)."""
+    a = _rad(angle_deg)
+    ca, sa = _cos(a), _sin(a)
+    return ((x, y * ca - z * sa, y * sa + z * ca) for x, y, z in pts)
 
-def _rot_y(pts, angle_deg):
-    a = math.radians(angle_deg)
-    ca, sa = math.cos(a), math.sin(a)
-    return [(x * ca + z * sa, y, -x * sa + z * ca) for x, y, z in pts]
+def _rot_y(pts, angle_deg, _rad=math.radians, _cos=math.cos, _sin=math.sin):
+    a = _rad(angle_deg)
+    ca, sa = _cos(a), _sin(a)
+    return ((x * ca + z * sa, y, -x * sa + z * ca) for x, y, z in pts)
 
-def _rot_z(pts, angle_deg):
-    a = math.radians(angle_deg)
-    ca, sa = math.cos(a), math.sin(a)
-    return [(x * ca - y * sa, x * sa + y * ca, z) for x, y, z in pts]
+def _rot_z(pts, angle_deg, _rad=math.radians, _cos=math.cos, _sin=math.sin):
+    a = _rad(angle_deg)
+    ca, sa = _cos(a), _sin(a)
+    return ((x * ca - y * sa, x * sa + y * ca, z) for x, y, z in pts)
 
 def _translate(pts, dx, dy, dz):
-    return [(x + dx, y + dy, z + dz) for x, y, z in pts]
+    return ((x + dx, y + dy, z + dz) for x, y, z in pts)
+
+def _build_rot_matrix(pitch, yaw, roll,
+                      _rad=math.radians, _cos=math.cos, _sin=math.sin):
+    """
+    Closed-form rotation equivalent to _rot_z(roll), then _rot_x(pitch),
+    then _rot_y(yaw) -- i.e. Ry @ Rx @ Rz for column vectors.  Returns a
+    3x3 tuple of row tuples; each angle's trig is evaluated once.
+    """
+    p, y, r = _rad(pitch), _rad(yaw), _rad(roll)
+    cp, sp = _cos(p), _sin(p)
+    cy, sy = _cos(y), _sin(y)
+    cr, sr = _cos(r), _sin(r)
+    sp_sr, sp_cr = sp * sr, sp * cr
+    return (
+        (cy * cr + sy * sp_sr, sy * sp_cr - cy * sr, sy * cp),
+        (cp * sr, cp * cr, -sp),
+        (cy * sp_sr - sy * cr, sy * sr + cy * sp_cr, cy * cp),
+    )
+
+def _compose_rotation(pitch, yaw, roll):
+    """_build_rot_matrix() as a 3x3 float32 array."""
+    return np.array(_build_rot_matrix(pitch, yaw, roll), dtype=np.float32)
+
+def _rotate(pts, m):
+    """Apply a _build_rot_matrix() matrix to (x,y,z) points (lazily)."""
+    (r00, r01, r02), (r10, r11, r12), (r20, r21, r22) = m
+    return ((r00 * x + r01 * y + r02 * z,
+             r10 * x + r11 * y + r12 * z,
+             r20 * x + r21 * y + r22 * z) for x, y, z in pts)
+
+def _transform_and_project(out, pts_t, rot, dx, dy, dz, cx, cy, fov, camera_z):
+    """
+    Fused rotate + translate + perspective divide into a preallocated
+    (3, N) float32 buffer.  pts_t is the (3, N) model; on return the rows
+    of out are screen x, screen y and clamped depth.
+    """
+    np.matmul(rot, pts_t, out=out)
+    sx, sy, zz = out
+    zz += dz + camera_z
+    np.maximum(zz, 0.1, out=zz)
+    sx += dx
+    sx *= fov
+    sx /= zz
+    sx += cx
+    sy += dy
+    sy *= -fov
+    sy /= zz
+    sy += cy
+    return out
 
 def _project(pts, cx, cy, fov=400, camera_z=5.0):
     """Perspective project 3D points to 2D screen coords."""
@@ -98,6 +168,7 @@ def _build_controller_model():
     verts = []
     edges = []
     faces = []
+    closed = []   # Faces of closed solids, which can be back-face culled
 
     # --- Handle body (rectangular prism) ---
     hw, hh, hd = 0.20, 0.60, 0.15
@@ -111,6 +182,7 @@ def _build_controller_model():
         edges.append((base+i, base+j))
     faces.append([base+4, base+5, base+6, base+7])
     faces.append([base+0, base+3, base+2, base+1])
+    closed.extend([True, True])
 
     # --- Trigger ---
     tw, td = 0.12, 0.10
@@ -123,6 +195,7 @@ def _build_controller_model():
     for i, j in [(0,1),(1,2),(2,3),(3,0)]:
         edges.append((base_t+i, base_t+j))
     faces.append([base_t+0, base_t+1, base_t+2, base_t+3])
+    closed.append(False)  # Single plane: visible from both sides
 
     # --- Tracking ring ---
     ring_r = 0.35
@@ -166,10 +239,92 @@ def _build_controller_model():
         for i, j in [(0,1),(1,2),(2,3),(3,0)]:
             edges.append((base_b+i, base_b+j))
 
-    return verts, edges, faces
+    return verts, edges, faces, closed
+
+
+_MODEL_VERTS, _MODEL_EDGES, _MODEL_FACES, _MODEL_FACE_CLOSED = _build_controller_model()
+
+if HAS_NUMPY:
+    _MODEL_VERTS_NP = np.asarray(_MODEL_VERTS, dtype=np.float32)
+    _MODEL_EDGES_NP = np.asarray(_MODEL_EDGES, dtype=np.intp)
+    # Faces padded to a uniform (F, 4) by repeating their last vertex, which
+    # adds a zero-length side (no area) for any triangles
+    _MODEL_FACE_SIZES = tuple(len(f) for f in _MODEL_FACES)
+    _MODEL_FACES_NP = np.asarray(
+        [f + [f[-1]] * (4 - len(f)) for f in _MODEL_FACES], dtype=np.intp
+    ).reshape(-1, 4)
+    _MODEL_FACE_CLOSED_NP = np.asarray(_MODEL_FACE_CLOSED, dtype=bool)
+    _MODEL_VERTS_T = np.ascontiguousarray(_MODEL_VERTS_NP.T)
+    # Shared by every canvas; only ever read
+    for _arr in (_MODEL_VERTS_NP, _MODEL_VERTS_T, _MODEL_EDGES_NP,
+                 _MODEL_FACES_NP, _MODEL_FACE_CLOSED_NP):
+        _arr.setflags(write=False)
+    del _arr
+
 
+# Edge depth-fade: alpha * (1 - (avg_z - 3) / 4), clamped to [40, alpha] and
+# quantised to multiples of 8, tabulated over avg_z in [3, 7) per alpha
+_DEPTH_LUT_SIZE = 256
+_DEPTH_LUT_SCALE = _DEPTH_LUT_SIZE / 4.0   # LUT steps per unit of depth
 
-_MODEL_VERTS, _MODEL_EDGES, _MODEL_FACES = _build_controller_model()
+
+@functools.lru_cache(maxsize=None)
+def _depth_alpha_lut(alpha):
+    return tuple(
+        max(40, min(alpha, int(alpha * (1.0 - k / _DEPTH_LUT_SIZE))) & ~7)
+        for k in range(_DEPTH_LUT_SIZE)
+    )
+
+
+# ============================================================
+# Shared paint resources (GUI thread only; alpha is set per frame)
+# ============================================================
+
+_CANVAS_BG = QColor(24, 24, 37)
+_FACE_COLOR = QColor(69, 71, 90)
+_FACE_BRUSH = QBrush(_FACE_COLOR)
+_EDGE_COLOR = QColor(137, 180, 250)
+_EDGE_PEN = QPen(_EDGE_COLOR, 1.5)
+_AXIS_COLORS = (QColor(243, 139, 168), QColor(166, 227, 161), QColor(137, 180, 250))
+_AXIS_PENS = tuple(QPen(c, 2) for c in _AXIS_COLORS)
+_TEXT_COLOR = QColor(166, 173, 200)
+_TEXT_FONT = QFont("Consolas", 9)
+_NOT_TRACKED_COLOR = QColor(243, 139, 168)
+_NOT_TRACKED_PEN = QPen(_NOT_TRACKED_COLOR, 2)
+_NOT_TRACKED_FONT = QFont("Segoe UI", 12)
+
+# Widget stylesheets, shared by every panel/overlay instance
+_OVERLAY_CAL_BTN_QSS = (
+    "QPushButton { background: transparent; color: #fab387; border: none; font-weight: bold; } "
+    "QPushButton:hover { color: #f9e2af; }"
+)
+_OVERLAY_LABEL_QSS = "color: #a6adc8; font-size: 11px;"
+_OVERLAY_SLIDER_QSS = """
+    QSlider::groove:horizontal { background: #313244; height: 4px; border-radius: 2px; }
+    QSlider::handle:horizontal { background: #89b4fa; width: 10px; margin: -3px 0; border-radius: 5px; }
+"""
+_OVERLAY_CLOSE_BTN_QSS = """
+    QPushButton { background: transparent; color: #6c7086; border: none; font-size: 12px; }
+    QPushButton:hover { color: #f38ba8; }
+"""
+_PANEL_CAL_BTN_QSS = """
+    QPushButton { background: #313244; color: #fab387; border: none;
+        border-radius: 4px; font-size: 16px; }
+    QPushButton:hover { background: #45475a; color: #f9e2af; }
+"""
+_PANEL_OVERLAY_BTN_QSS = """
+    QPushButton { background: #313244; color: #cdd6f4; border: none; border-radius: 4px; font-size: 14px; }
+    QPushButton:hover { background: #45475a; }
+"""
+
+
+@functools.lru_cache(maxsize=512)
+def _readout_static_text(text):
+    """Laid-out readout text and its (width, height); laid out once per string."""
+    static = QStaticText(text)
+    static.prepare(font=_TEXT_FONT)
+    size = static.size()
+    return static, size.width(), size.height()
 
 
 # ============================================================
@@ -179,94 +334,210 @@ _MODEL_VERTS, _MODEL_EDGES, _MODEL_FACES = _build_controller_model()
 class _ControllerRenderer:
     """Stateless renderer: call render() with a QPainter and current angles."""
 
+    # Scratch polygon reused for every face (GUI thread only)
+    _FACE_POLY = QPolygonF([QPointF(), QPointF(), QPointF(), QPointF()])
+
     @staticmethod
-    def render(painter: QPainter, width: int, height: int,
-               pitch: float, yaw: float, roll: float,
-               pos_x: float, pos_y: float, pos_z: float,
-               is_tracked: bool, alpha: int = 255,
-               raw_pitch: float = 0, raw_yaw: float = 0, raw_roll: float = 0):
-        
+    def project(width: int, height: int,
+                pitch: float, yaw: float, roll: float,
+                pos_x: float, pos_y: float, pos_z: float, out=None):
+        """
+        Transform and project the model; returns (sx, sy, zz) as the rows of
+        a (3, N) array, or as lists without NumPy.  `out` is an optional
+        caller-owned scratch array shaped like _MODEL_VERTS_T to write into.
+        """
         cx = width / 2
         cy = height / 2
         fov = min(width, height) * 0.9
 
-        # Start from base model
-        pts = list(_MODEL_VERTS)
-
-        # Apply controller rotation (order: roll -> pitch -> yaw)
-        # Using VISUAL (calibrated) angles
-        pts = _rot_z(pts, roll)
-        pts = _rot_x(pts, pitch)
-        pts = _rot_y(pts, yaw)
-
         dx = max(-1, min(1, pos_x)) * 0.4
         dy = max(-1, min(1, pos_y - 0.7)) * 0.4
         dz = max(-1, min(1, pos_z)) * 0.4
-        pts = _translate(pts, dx, dy, dz)
 
-        projected = _project(pts, cx, cy, fov, camera_z=4.0)
+        # Apply controller rotation (order: roll -> pitch -> yaw)
+        # Using VISUAL (calibrated) angles
+        if HAS_NUMPY:
+            # One matrix product for the whole model, then an in-place
+            # perspective divide with no temporaries
+            if out is None:
+                out = np.empty_like(_MODEL_VERTS_T)
+            return _transform_and_project(
+                out, _MODEL_VERTS_T, _compose_rotation(pitch, yaw, roll),
+                dx, dy, dz, cx, cy, fov, 4.0)
+
+        projected = _project(
+            _translate(_rotate(_MODEL_VERTS, _build_rot_matrix(pitch, yaw, roll)),
+                       dx, dy, dz),
+            cx, cy, fov, camera_z=4.0)
+        return ([p[0] for p in projected], [p[1] for p in projected],
+                [p[2] for p in projected])
 
+    @staticmethod
+    def render(painter: QPainter, width: int, height: int,
+               pitch: float, yaw: float, roll: float,
+               pos_x: float, pos_y: float, pos_z: float,
+               is_tracked: bool, alpha: int = 255,
+               raw_pitch: float = 0, raw_yaw: float = 0, raw_roll: float = 0,
+               projected=None):
+        """Draw the controller. `projected` may be a cached project() result."""
         if not is_tracked:
             _ControllerRenderer._draw_not_tracked(painter, width, height, alpha)
             return
 
-        # Faces
-        for face_indices in _MODEL_FACES:
-            face_pts = [projected[i] for i in face_indices]
-            if len(face_pts) >= 3:
-                path = QPainterPath()
-                path.moveTo(face_pts[0][0], face_pts[0][1])
-                for fp in face_pts[1:]:
-                    path.lineTo(fp[0], fp[1])
-                path.closeSubpath()
-                face_color = QColor(69, 71, 90, min(alpha, 80))
-                painter.setPen(Qt.PenStyle.NoPen)
-                painter.setBrush(QBrush(face_color))
-                painter.drawPath(path)
-
-        # Edges
-        for i, j in _MODEL_EDGES:
-            x1, y1, z1 = projected[i]
-            x2, y2, z2 = projected[j]
-            avg_z = (z1 + z2) / 2
-            depth_alpha = max(40, min(alpha, int(alpha * (1.0 - (avg_z - 3.0) / 4.0))))
-            pen = QPen(QColor(137, 180, 250, depth_alpha), 1.5)
+        _ControllerRenderer.render_model(
+            painter, width, height, pitch, yaw, roll,
+            pos_x, pos_y, pos_z, alpha, projected)
+        _ControllerRenderer.render_readout(
+            painter, width, height, alpha, raw_pitch, raw_yaw, raw_roll)
+
+    @staticmethod
+    def render_model(painter: QPainter, width: int, height: int,
+                     pitch: float, yaw: float, roll: float,
+                     pos_x: float, pos_y: float, pos_z: float,
+                     alpha: int = 255, projected=None):
+        """Draw faces, edges and axis markers of a tracked controller."""
+        cx = width / 2
+        cy = height / 2
+        fov = min(width, height) * 0.9
+
+        dx = max(-1, min(1, pos_x)) * 0.4
+        dy = max(-1, min(1, pos_y - 0.7)) * 0.4
+        dz = max(-1, min(1, pos_z)) * 0.4
+
+        if projected is None:
+            projected = _ControllerRenderer.project(
+                width, height, pitch, yaw, roll, pos_x, pos_y, pos_z)
+        sx, sy, zz = projected
+
+        # Faces (closed-solid faces wound away from the camera are skipped).
+        # All faces are convex and share one colour, so set the brush once
+        # and reuse a single polygon buffer.
+        _FACE_COLOR.setAlpha(min(alpha, 80))
+        _FACE_BRUSH.setColor(_FACE_COLOR)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(_FACE_BRUSH)
+        poly = _ControllerRenderer._FACE_POLY
+        for xs, ys in _ControllerRenderer._visible_faces(sx, sy):
+            if poly.size() != len(xs):
+                poly.resize(len(xs))
+            for k in range(len(xs)):
+                poly[k] = QPointF(xs[k], ys[k])
+            painter.drawConvexPolygon(poly)
+
+        # Edges, grouped by depth-alpha bucket: one pen and one drawLines
+        # call per bucket
+        segments = _ControllerRenderer._edge_segments(sx, sy)
+        for depth_alpha, edge_ids in _ControllerRenderer._edge_buckets(zz, alpha):
+            _EDGE_COLOR.setAlpha(depth_alpha)
+            _EDGE_PEN.setColor(_EDGE_COLOR)
+            painter.setPen(_EDGE_PEN)
+            painter.drawLines([QLineF(*segments[e]) for e in edge_ids])
+
+        # Axes: the origin rotates to itself, and each 0.3-long unit axis
+        # rotates to 0.3x the matching matrix column; project all 4 at once
+        m = _build_rot_matrix(pitch, yaw, roll)
+        axis_pts = [(dx, dy, dz)] + [
+            (dx + 0.3 * m[0][k], dy + 0.3 * m[1][k], dz + 0.3 * m[2][k])
+            for k in range(3)
+        ]
+        (ox, oy, _), *tips = _project(axis_pts, cx, cy, fov, 4.0)
+        origin_pt = QPointF(ox, oy)
+        for (ax, ay, _), color, pen in zip(tips, _AXIS_COLORS, _AXIS_PENS):
+            color.setAlpha(alpha)
+            pen.setColor(color)
             painter.setPen(pen)
-            painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
-
-        # Axes
-        origin = [(0, 0, 0)]
-        ax_x = [(0.3, 0, 0)]
-        ax_y = [(0, 0.3, 0)]
-        ax_z = [(0, 0, 0.3)]
-
-        for ax_pts, color in [(ax_x, QColor(243, 139, 168, alpha)),
-                               (ax_y, QColor(166, 227, 161, alpha)),
-                               (ax_z, QColor(137, 180, 250, alpha))]:
-            o = _rot_z(_rot_x(_rot_y(origin, yaw), pitch), roll)
-            a = _rot_z(_rot_x(_rot_y(ax_pts, yaw), pitch), roll)
-            o = _translate(o, dx, dy, dz)
-            a = _translate(a, dx, dy, dz)
-            po = _project(o, cx, cy, fov, 4.0)
-            pa = _project(a, cx, cy, fov, 4.0)
-            painter.setPen(QPen(color, 2))
-            painter.drawLine(QPointF(po[0][0], po[0][1]),
-                             QPointF(pa[0][0], pa[0][1]))
+            painter.drawLine(origin_pt, QPointF(ax, ay))
 
+    @staticmethod
+    def render_readout(painter: QPainter, width: int, height: int, alpha: int,
+                       raw_pitch: float, raw_yaw: float, raw_roll: float):
+        """Draw the angle readout along the bottom edge."""
         # Text - Always display RAW values
-        font = QFont("Consolas", 9)
-        painter.setFont(font)
-        text_color = QColor(166, 173, 200, alpha)
-        painter.setPen(text_color)
+        painter.setFont(_TEXT_FONT)
+        _TEXT_COLOR.setAlpha(alpha)
+        painter.setPen(_TEXT_COLOR)
         text = f"P:{raw_pitch:+.0f}° Y:{raw_yaw:+.0f}° R:{raw_roll:+.0f}°"
-        painter.drawText(QRectF(4, height - 20, width - 8, 18),
-                         Qt.AlignmentFlag.AlignCenter, text)
+        # Centre in the (4, height - 20, width - 8, 18) strip
+        static, tw, th = _readout_static_text(text)
+        painter.drawStaticText(QPointF(4 + (width - 8 - tw) / 2,
+                                       height - 20 + (18 - th) / 2), static)
+
+    @staticmethod
+    def _visible_faces(sx, sy):
+        """
+        Yield (xs, ys) screen coordinates of each face to draw, skipping
+        closed-solid faces that point away from the camera.
+        """
+        if HAS_NUMPY:
+            fx = sx[_MODEL_FACES_NP]
+            fy = sy[_MODEL_FACES_NP]
+            area = (fx * np.roll(fy, -1, axis=1)
+                    - np.roll(fx, -1, axis=1) * fy).sum(axis=1)
+            keep = ~_MODEL_FACE_CLOSED_NP | (area > 0)
+            for f in np.flatnonzero(keep).tolist():
+                n = _MODEL_FACE_SIZES[f]
+                if n >= 3:
+                    yield fx[f, :n].tolist(), fy[f, :n].tolist()
+            return
+
+        for face_indices, closed in zip(_MODEL_FACES, _MODEL_FACE_CLOSED):
+            if len(face_indices) < 3:
+                continue
+            if closed and _ControllerRenderer._screen_area(
+                    sx, sy, face_indices) <= 0:
+                continue
+            yield [sx[i] for i in face_indices], [sy[i] for i in face_indices]
+
+    @staticmethod
+    def _edge_segments(sx, sy):
+        """Per-edge (x1, y1, x2, y2) screen segments, indexed like _MODEL_EDGES."""
+        if HAS_NUMPY:
+            i, j = _MODEL_EDGES_NP.T
+            return np.stack((sx[i], sy[i], sx[j], sy[j]), axis=1).tolist()
+        return [(sx[i], sy[i], sx[j], sy[j]) for i, j in _MODEL_EDGES]
+
+    @staticmethod
+    def _screen_area(sx, sy, face_indices):
+        """Twice the signed screen-space area; > 0 when the face is front-facing."""
+        area = 0.0
+        prev = face_indices[-1]
+        for i in face_indices:
+            area += sx[prev] * sy[i] - sx[i] * sy[prev]
+            prev = i
+        return area
+
+    @staticmethod
+    def _edge_buckets(zz, alpha):
+        """
+        Yield (depth_alpha, edge indices) with depth_alpha quantised to
+        multiples of 8, fading edges further from the camera.
+        """
+        lut = _depth_alpha_lut(alpha)
+        if HAS_NUMPY:
+            avg_z = zz[_MODEL_EDGES_NP].mean(axis=1)
+            idx = ((avg_z - 3.0) * _DEPTH_LUT_SCALE).astype(np.int32)
+            np.clip(idx, 0, _DEPTH_LUT_SIZE - 1, out=idx)
+            depth = np.asarray(lut)[idx]
+            order = np.argsort(depth, kind="stable")
+            values, starts = np.unique(depth[order], return_index=True)
+            for k, value in enumerate(values.tolist()):
+                stop = starts[k + 1] if k + 1 < len(starts) else len(order)
+                yield value, order[starts[k]:stop].tolist()
+            return
+
+        buckets = {}
+        last = _DEPTH_LUT_SIZE - 1
+        for e, (i, j) in enumerate(_MODEL_EDGES):
+            k = int(((zz[i] + zz[j]) / 2 - 3.0) * _DEPTH_LUT_SCALE)
+            buckets.setdefault(lut[min(last, max(0, k))], []).append(e)
+        yield from buckets.items()
 
     @staticmethod
     def _draw_not_tracked(painter, width, height, alpha):
-        painter.setPen(QPen(QColor(243, 139, 168, alpha), 2))
-        font = QFont("Segoe UI", 12)
-        painter.setFont(font)
+        _NOT_TRACKED_COLOR.setAlpha(alpha)
+        _NOT_TRACKED_PEN.setColor(_NOT_TRACKED_COLOR)
+        painter.setPen(_NOT_TRACKED_PEN)
+        painter.setFont(_NOT_TRACKED_FONT)
         painter.drawText(
             QRectF(0, 0, width, height),
             Qt.AlignmentFlag.AlignCenter,
@@ -278,21 +549,37 @@ class _ControllerRenderer:
 # Shared canvas widget
 # ============================================================
 
+# Views kept per canvas; ~250 KB each at the default overlay size
+_MODEL_CACHE_SIZE = 64
+
+
 class _VizCanvas(QWidget):
     """
     Widget that paints the 3D controller.
     Subscribes to _SHARED_STATE for calibration offsets.
     """
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, opaque=False):
         super().__init__(parent)
+        # Docked canvases paint their own backdrop so Qt never has to
+        # repaint the widgets underneath on every pose update
+        self._opaque = opaque
+        if opaque:
+            self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
         self._pitch = self._yaw = self._roll = 0.0
         self._px = self._py = self._pz = 0.0
         self._is_tracked = False
         self._alpha = 255
-        
+
+        # Skip repaints for poses that don't visibly change (0.1 deg / 1 mm)
+        self._last_pose_key = None
+        # Rasterised model views keyed on quantised pose (LRU, newest last)
+        self._model_cache = OrderedDict()
+        # Per-canvas projection scratch, so canvases never share output
+        self._proj_buf = np.empty_like(_MODEL_VERTS_T) if HAS_NUMPY else None
+
         # Connect to shared global calibration
-        _SHARED_STATE.state_changed.connect(self.update)
+        _SHARED_STATE.state_changed.connect(self._on_shared_changed)
 
     def set_state(self, pitch, yaw, roll, x, y, z, is_tracked, alpha=255):
         self._pitch = pitch
@@ -303,44 +590,114 @@ class _VizCanvas(QWidget):
         self._pz = z
         self._is_tracked = is_tracked
         self._alpha = alpha
+        if not self.isVisible():
+            # Hidden: showing the widget paints the stored state
+            self._last_pose_key = None
+            return
+        key = (round(pitch, 1), round(yaw, 1), round(roll, 1),
+               round(x, 3), round(y, 3), round(z, 3), is_tracked, alpha)
+        if key == self._last_pose_key:
+            return
+        self._last_pose_key = key
         self.update()
 
+    def set_alpha(self, alpha: int):
+        """Change the paint alpha without a new pose."""
+        if alpha == self._alpha:
+            return
+        self._alpha = alpha
+        self._last_pose_key = None
+        if self.isVisible():
+            self.update()
+
+    def _on_shared_changed(self):
+        if self.isVisible():
+            self.update()
+
     def calibrate(self):
         """Update global state with current rotation as new zero."""
         _SHARED_STATE.set_offsets(self._pitch, self._yaw, self._roll)
         # No need to call update(), signal will trigger it.
 
     def paintEvent(self, event):
-        p = QPainter(self)
-        p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        bg_alpha = min(self._alpha, 40)
-        p.fillRect(self.rect(), QColor(24, 24, 37, bg_alpha))
-
-        # Retrieve shared offsets
-        off_p, off_y, off_r = _SHARED_STATE.get_offsets()
-
-        # Calculate visual rotation
-        vis_p = self._pitch - off_p
-        vis_y = self._yaw - off_y
-        vis_r = self._roll - off_r
-
-        _ControllerRenderer.render(
-            p, self.width(), self.height(),
-            vis_p, vis_y, vis_r,  # Visual
-            self._px, self._py, self._pz,
-            self._is_tracked, self._alpha,
-            raw_pitch=self._pitch, # Raw for text
-            raw_yaw=self._yaw,
-            raw_roll=self._roll
-        )
-        p.end()
+        with QPainter(self) as p:
+            if self._opaque:
+                p.fillRect(self.rect(), self.palette().window())
+            _CANVAS_BG.setAlpha(min(self._alpha, 40))
+            p.fillRect(self.rect(), _CANVAS_BG)
+            # AA only for the model's slanted edges, faces and text
+            p.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+            # Retrieve shared offsets
+            off_p, off_y, off_r = _SHARED_STATE.get_offsets()
+
+            # Calculate visual rotation
+            vis_p = self._pitch - off_p
+            vis_y = self._yaw - off_y
+            vis_r = self._roll - off_r
+
+            w, h = self.width(), self.height()
+            if not self._is_tracked:
+                _ControllerRenderer._draw_not_tracked(p, w, h, self._alpha)
+                return
+            p.drawPixmap(0, 0, self._model_pixmap(w, h, vis_p, vis_y, vis_r))
+            _ControllerRenderer.render_readout(
+                p, w, h, self._alpha, self._pitch, self._yaw, self._roll)
+
+    def _model_pixmap(self, w, h, vis_p, vis_y, vis_r) -> QPixmap:
+        """
+        Return the model drawn at the pose rounded to whole degrees and
+        centimetre-ish positions, rendering it only on a cache miss.
+        """
+        dpr = self.devicePixelRatioF()
+        qp, qy, qr = round(vis_p), round(vis_y), round(vis_r)
+        qx, qyy, qz = round(self._px, 2), round(self._py, 2), round(self._pz, 2)
+        key = (w, h, dpr, self._alpha, qp, qy, qr, qx, qyy, qz)
+        cache = self._model_cache
+        pixmap = cache.get(key)
+        if pixmap is not None:
+            cache.move_to_end(key)
+            return pixmap
+
+        projected = _ControllerRenderer.project(
+            w, h, qp, qy, qr, qx, qyy, qz, out=self._proj_buf)
+        pixmap = QPixmap(round(w * dpr), round(h * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        with QPainter(pixmap) as p:
+            p.setRenderHint(QPainter.RenderHint.Antialiasing)
+            _ControllerRenderer.render_model(
+                p, w, h, qp, qy, qr, qx, qyy, qz, self._alpha, projected)
+        cache[key] = pixmap
+        if len(cache) > _MODEL_CACHE_SIZE:
+            cache.popitem(last=False)
+        return pixmap
+
+    def resizeEvent(self, event):
+        # Every cached view is for the old size
+        self._model_cache.clear()
+        super().resizeEvent(event)
 
 
 # ============================================================
 # Floating overlay widget
 # ============================================================
 
+@functools.lru_cache(maxsize=32)
+def _grip_pixmap(alpha, dpr=1.0):
+    """16x16 triangular resize-grip dot pattern, pre-rasterised per alpha."""
+    pixmap = QPixmap(round(16 * dpr), round(16 * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    # Whole-pixel dots: AA would only smear them across neighbours
+    with QPainter(pixmap) as p:
+        p.setPen(QPen(QColor(88, 91, 112, alpha), 1))
+        for i in range(3):
+            for j in range(3 - i):
+                p.drawPoint(4 + i * 4, 4 + j * 4)
+    return pixmap
+
+
 class ControllerVizOverlay(QWidget):
     
     closed = pyqtSignal()
@@ -363,10 +720,24 @@ class ControllerVizOverlay(QWidget):
         self._anchor_parent = parent
         self._opacity = 200
         self._dragging = False
-        self._resizing = False
         self._drag_offset = QPoint()
-        self._resize_start_size = QSize()
-        self._resize_start_pos = QPoint()
+        self._drag_bounds = None  # (min_x, max_x, min_y, max_y) during a drag
+        self._cursor_shape = Qt.CursorShape.ArrowCursor
+
+        # Pre-rendered background/title/border/grip, keyed on (size, opacity)
+        self._chrome_cache = None
+        self._chrome_key = None
+        self._chrome_alphas = None
+        self._update_chrome_colors()
+
+        # Pose samples arrive faster than the display refreshes; keep only
+        # the latest and forward it at most once per frame
+        self._last_state = None
+        self._pending_state = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush_state)
 
         self._build_ui()
 
@@ -389,39 +760,34 @@ class ControllerVizOverlay(QWidget):
         cal_btn = QPushButton("Cal")
         cal_btn.setFixedSize(20, 20)
         cal_btn.setToolTip("Calibrate (Ctrl+R)")
-        cal_btn.setStyleSheet("QPushButton { background: transparent; color: #fab387; border: none; font-weight: bold; } QPushButton:hover { color: #f9e2af; }")
+        cal_btn.setStyleSheet(_OVERLAY_CAL_BTN_QSS)
         cal_btn.clicked.connect(self._calibrate)
         title_layout.addWidget(cal_btn)
         
         title_layout.addStretch()
 
         opacity_label = QLabel("Op:")
-        opacity_label.setStyleSheet("color: #a6adc8; font-size: 11px;")
+        opacity_label.setStyleSheet(_OVERLAY_LABEL_QSS)
         title_layout.addWidget(opacity_label)
 
         self._opacity_slider = QSlider(Qt.Orientation.Horizontal)
         self._opacity_slider.setRange(30, 255)
         self._opacity_slider.setValue(self._opacity)
         self._opacity_slider.setFixedWidth(60)
-        self._opacity_slider.setStyleSheet("""
-            QSlider::groove:horizontal { background: #313244; height: 4px; border-radius: 2px; }
-            QSlider::handle:horizontal { background: #89b4fa; width: 10px; margin: -3px 0; border-radius: 5px; }
-        """)
+        self._opacity_slider.setStyleSheet(_OVERLAY_SLIDER_QSS)
         self._opacity_slider.valueChanged.connect(self._on_opacity_changed)
         title_layout.addWidget(self._opacity_slider)
 
         close_btn = QPushButton("X")
         close_btn.setFixedSize(20, 20)
-        close_btn.setStyleSheet("""
-            QPushButton { background: transparent; color: #6c7086; border: none; font-size: 12px; }
-            QPushButton:hover { color: #f38ba8; }
-        """)
+        close_btn.setStyleSheet(_OVERLAY_CLOSE_BTN_QSS)
         close_btn.clicked.connect(self._close)
         title_layout.addWidget(close_btn)
 
         layout.addWidget(self._title_bar)
 
         self._canvas = _VizCanvas()
+        self._canvas.set_alpha(self._opacity)
         layout.addWidget(self._canvas, 1)
 
         self._grip = QSizeGrip(self)
@@ -429,8 +795,21 @@ class ControllerVizOverlay(QWidget):
         self._grip.setStyleSheet("background: transparent;")
 
     def set_controller_state(self, pitch, yaw, roll, x, y, z, is_tracked):
-        self._canvas.set_state(pitch, yaw, roll, x, y, z, is_tracked,
-                               alpha=self._opacity)
+        if not self.isVisible():
+            return  # Closed, or on an inactive tab/dock: drop the sample
+        key = (round(pitch, 3), round(yaw, 3), round(roll, 3),
+               round(x, 4), round(y, 4), round(z, 4), is_tracked)
+        if key == self._last_state:
+            return  # Stationary controller: nothing new to show
+        self._last_state = key
+        self._pending_state = (pitch, yaw, roll, x, y, z, is_tracked)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_state(self):
+        if self._pending_state is not None:
+            self._canvas.set_state(*self._pending_state, alpha=self._opacity)
+            self._pending_state = None
 
     def _calibrate(self):
         self._canvas.calibrate()
@@ -443,8 +822,28 @@ class ControllerVizOverlay(QWidget):
 
     def _on_opacity_changed(self, val):
         self._opacity = val
+        # A still controller sends no poses, so push the alpha directly
+        self._canvas.set_alpha(val)
+        if self._update_chrome_colors():
+            self._chrome_cache = None
         self.update()
 
+    def _update_chrome_colors(self) -> bool:
+        """
+        Derive the opacity-clamped chrome colours; returns True when they
+        changed (above the clamps, opacity no longer affects the chrome).
+        """
+        op = self._opacity
+        alphas = (min(op, 220), min(op, 240), min(op, 160), min(op, 120))
+        if alphas == self._chrome_alphas:
+            return False
+        self._chrome_alphas = alphas
+        self._bg_color = QColor(24, 24, 37, alphas[0])
+        self._title_color = QColor(30, 30, 46, alphas[1])
+        self._border_pen = QPen(QColor(69, 71, 90, alphas[2]), 1)
+        self._grip_alpha = alphas[3]
+        return True
+
     def _close(self):
         self.hide()
         self.closed.emit()
@@ -454,70 +853,99 @@ class ControllerVizOverlay(QWidget):
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton:
             if event.position().y() < self.TITLE_HEIGHT:
+                # Let the window manager run the drag when it can. Native
+                # moves cannot be clamped live, so an overlay anchored to a
+                # parent keeps the manual drag below
+                handle = self.windowHandle()
+                if (not self._anchor_parent and handle is not None
+                        and handle.startSystemMove()):
+                    event.accept()
+                    return
                 self._dragging = True
                 self._drag_offset = event.globalPosition().toPoint() - self.pos()
-            elif (event.position().x() > self.width() - 16 and
-                  event.position().y() > self.height() - 16):
-                self._resizing = True
-                self._resize_start_size = self.size()
-                self._resize_start_pos = event.globalPosition().toPoint()
+                # Parent geometry is fixed for the gesture; map it once
+                self._drag_bounds = self._anchor_bounds()
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QMouseEvent):
         if self._dragging:
-            new_pos = event.globalPosition().toPoint() - self._drag_offset
-            if self._anchor_parent:
-                parent_global = self._anchor_parent.mapToGlobal(
-                    self._anchor_parent.rect().topLeft()
-                )
-                pw = self._anchor_parent.width()
-                ph = self._anchor_parent.height()
-                new_pos.setX(max(parent_global.x(),
-                                 min(parent_global.x() + pw - self.width(), new_pos.x())))
-                new_pos.setY(max(parent_global.y(),
-                                 min(parent_global.y() + ph - self.height(), new_pos.y())))
-            self.move(new_pos)
-        elif self._resizing:
-            delta = event.globalPosition().toPoint() - self._resize_start_pos
-            new_w = max(self.MIN_SIZE.width(), self._resize_start_size.width() + delta.x())
-            new_h = max(self.MIN_SIZE.height(), self._resize_start_size.height() + delta.y())
-            self.resize(new_w, new_h)
+            self.move(self._clamp_to_anchor(
+                event.globalPosition().toPoint() - self._drag_offset))
         else:
-            if (event.position().x() > self.width() - 16 and
-                    event.position().y() > self.height() - 16):
-                self.setCursor(Qt.CursorShape.SizeFDiagCursor)
-            elif event.position().y() < self.TITLE_HEIGHT:
-                self.setCursor(Qt.CursorShape.OpenHandCursor)
+            # The QSizeGrip child handles resizing and its own cursor
+            if event.position().y() < self.TITLE_HEIGHT:
+                self._set_cursor_shape(Qt.CursorShape.OpenHandCursor)
             else:
-                self.setCursor(Qt.CursorShape.ArrowCursor)
+                self._set_cursor_shape(Qt.CursorShape.ArrowCursor)
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         self._dragging = False
-        self._resizing = False
-        self.setCursor(Qt.CursorShape.ArrowCursor)
+        self._drag_bounds = None
+        self._set_cursor_shape(Qt.CursorShape.ArrowCursor)
         super().mouseReleaseEvent(event)
 
+    def _anchor_bounds(self):
+        """Allowed top-left range (min_x, max_x, min_y, max_y), or None."""
+        if not self._anchor_parent:
+            return None
+        parent_global = self._anchor_parent.mapToGlobal(
+            self._anchor_parent.rect().topLeft()
+        )
+        x, y = parent_global.x(), parent_global.y()
+        return (x, x + self._anchor_parent.width() - self.width(),
+                y, y + self._anchor_parent.height() - self.height())
+
+    def _clamp_to_anchor(self, pos: QPoint) -> QPoint:
+        """Keep a top-left window position inside the anchor parent."""
+        bounds = self._drag_bounds or self._anchor_bounds()
+        if bounds is None:
+            return pos
+        min_x, max_x, min_y, max_y = bounds
+        return QPoint(max(min_x, min(max_x, pos.x())),
+                      max(min_y, min(max_y, pos.y())))
+
+    def _set_cursor_shape(self, shape):
+        # setCursor round-trips to the windowing system even when unchanged
+        if shape != self._cursor_shape:
+            self._cursor_shape = shape
+            self.setCursor(shape)
+
+    def _render_chrome(self) -> QPixmap:
+        """Paint the static window chrome into a transparent pixmap."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        with QPainter(pixmap) as p:
+            p.fillRect(self.rect(), self._bg_color)
+            p.fillRect(0, 0, self.width(), self.TITLE_HEIGHT, self._title_color)
+            # Only the rounded border needs AA
+            p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+            p.setPen(self._border_pen)
+            p.setBrush(Qt.BrushStyle.NoBrush)
+            p.drawRoundedRect(self.rect().adjusted(0, 0, -1, -1), 6, 6)
+            p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+            p.drawPixmap(self.width() - 16, self.height() - 16,
+                         _grip_pixmap(self._grip_alpha, pixmap.devicePixelRatio()))
+        return pixmap
+
     def paintEvent(self, event):
-        p = QPainter(self)
-        p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        bg = QColor(24, 24, 37, min(self._opacity, 220))
-        p.fillRect(self.rect(), bg)
-        title_bg = QColor(30, 30, 46, min(self._opacity, 240))
-        p.fillRect(0, 0, self.width(), self.TITLE_HEIGHT, title_bg)
-        border = QColor(69, 71, 90, min(self._opacity, 160))
-        p.setPen(QPen(border, 1))
-        p.setBrush(Qt.BrushStyle.NoBrush)
-        p.drawRoundedRect(self.rect().adjusted(0, 0, -1, -1), 6, 6)
-        grip_color = QColor(88, 91, 112, min(self._opacity, 120))
-        p.setPen(QPen(grip_color, 1))
-        bx, by = self.width() - 12, self.height() - 12
-        for i in range(3):
-            for j in range(3 - i):
-                p.drawPoint(bx + i * 4, by + j * 4)
-        p.end()
-    
+        key = (self.width(), self.height(), self._chrome_alphas,
+               self.devicePixelRatioF())
+        if self._chrome_cache is None or key != self._chrome_key:
+            self._chrome_cache = self._render_chrome()
+            self._chrome_key = key
+        # Copy only the damaged part of the chrome (source rect in device px)
+        dirty = QRectF(event.rect())
+        dpr = self._chrome_cache.devicePixelRatio()
+        source = QRectF(dirty.x() * dpr, dirty.y() * dpr,
+                        dirty.width() * dpr, dirty.height() * dpr)
+        with QPainter(self) as p:
+            p.drawPixmap(dirty, self._chrome_cache, source)
+
     def resizeEvent(self, event):
+        self._chrome_cache = None
         self._grip.move(self.width() - self._grip.width(),
                         self.height() - self._grip.height())
         super().resizeEvent(event)
@@ -551,30 +979,45 @@ class ControllerVizPanel(QWidget):
         self.cal_btn = QPushButton("Cal")
         self.cal_btn.setToolTip("Calibrate Center (Ctrl+R)")
         self.cal_btn.setFixedSize(24, 24)
-        self.cal_btn.setStyleSheet("""
-            QPushButton { background: #313244; color: #fab387; border: none;
-                border-radius: 4px; font-size: 16px; }
-            QPushButton:hover { background: #45475a; color: #f9e2af; }
-        """)
+        self.cal_btn.setStyleSheet(_PANEL_CAL_BTN_QSS)
         self.cal_btn.clicked.connect(self.calibrate_now)
         header.addWidget(self.cal_btn)
 
         overlay_btn = QPushButton("[^]")
         overlay_btn.setToolTip("Pop out as floating overlay (Ctrl+4)")
         overlay_btn.setFixedSize(24, 24)
-        overlay_btn.setStyleSheet("""
-            QPushButton { background: #313244; color: #cdd6f4; border: none; border-radius: 4px; font-size: 14px; }
-            QPushButton:hover { background: #45475a; }
-        """)
+        overlay_btn.setStyleSheet(_PANEL_OVERLAY_BTN_QSS)
         overlay_btn.clicked.connect(self.overlay_requested.emit)
         header.addWidget(overlay_btn)
         layout.addLayout(header)
 
-        self._canvas = _VizCanvas()
+        self._canvas = _VizCanvas(opaque=True)
         layout.addWidget(self._canvas, 1)
 
+        # Forward at most one pose per display frame (latest wins)
+        self._last_state = None
+        self._pending_state = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush_state)
+
     def set_controller_state(self, pitch, yaw, roll, x, y, z, is_tracked):
-        self._canvas.set_state(pitch, yaw, roll, x, y, z, is_tracked)
+        if not self.isVisible():
+            return  # Closed, or on an inactive tab/dock: drop the sample
+        key = (round(pitch, 3), round(yaw, 3), round(roll, 3),
+               round(x, 4), round(y, 4), round(z, 4), is_tracked)
+        if key == self._last_state:
+            return  # Stationary controller: nothing new to show
+        self._last_state = key
+        self._pending_state = (pitch, yaw, roll, x, y, z, is_tracked)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_state(self):
+        if self._pending_state is not None:
+            self._canvas.set_state(*self._pending_state)
+            self._pending_state = None
 
     def calibrate_now(self):
         self._canvas.calibrate()
@@ -29,10 +29,18 @@ Bundle export (.funscript_bundle) combines all axes + metadata into
 a single JSON file for easy sharing.
 """
 
+import bisect
 import json
 import os
+import zipfile
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 
 # Axis definitions matching funscript multi-axis spec
@@ -51,7 +59,52 @@ BUNDLE_FORMAT = "funscript-motion-creator-bundle"
 BUNDLE_VERSION = "1.0"
 
 
-@dataclass
+def _dumps(obj) -> bytes:
+    """Indented UTF-8 JSON bytes, using orjson's C encoder when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(filepath: str, obj):
+    with open(filepath, 'wb') as f:
+        f.write(_dumps(obj))
+
+
+def _write_json_stream(f, items, indent: bytes = b"\n  "):
+    """
+    Write a JSON object to binary file f from (key, value) pairs, one value
+    at a time.  A value that is itself an iterator of pairs is streamed as a
+    nested object.  Output is byte-identical to _dumps() of the equivalent
+    dict, but only one value is ever serialized in memory at once.
+    """
+    f.write(b"{")
+    first = True
+    for key, value in items:
+        f.write((b"" if first else b",") + indent + _dumps(key) + b": ")
+        first = False
+        if isinstance(value, Iterator):
+            _write_json_stream(f, value, indent + b"  ")
+        else:
+            # JSON strings never contain raw newlines, so this only re-indents
+            f.write(_dumps(value).replace(b"\n", indent))
+    f.write((b"" if first else indent[:-2]) + b"}")
+
+
+def _read_json(filepath: str):
+    with open(filepath, 'rb') as f:
+        return _loads(f.read())
+
+
+@dataclass(slots=True)
 class FunscriptAction:
     """A single funscript action point."""
     at: int    # Timestamp in milliseconds
@@ -65,44 +118,119 @@ class FunscriptAction:
         return cls(at=int(d["at"]), pos=int(d["pos"]))
 
 
+def _action_at(action: FunscriptAction) -> int:
+    return action.at
+
+
 @dataclass
 class FunscriptAxis:
-    """Data for a single funscript axis."""
+    """
+    Data for a single funscript axis.
+
+    actions is kept sorted by timestamp so range queries and edits can use
+    bisection; code that mutates the list directly should call
+    sort_actions() afterwards, and code that edits actions in place without
+    re-sorting should call mark_dirty() so cached views are rebuilt.
+    """
     axis_name: str
     actions: list[FunscriptAction] = field(default_factory=list)
     inverted: bool = False
     range_val: int = 100
+    # Bumped by every mutating method; lets views cache derived geometry
+    revision: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.sort_actions()
+
+    def mark_dirty(self):
+        """Bump revision after in-place edits."""
+        self.revision += 1
 
     def sort_actions(self):
         """Sort actions by timestamp."""
-        self.actions.sort(key=lambda a: a.at)
+        self.actions.sort(key=_action_at)
+        self.mark_dirty()
+
+    def _range_bounds(self, start_ms: int, end_ms: int) -> tuple[int, int]:
+        """Slice bounds of actions with start_ms <= at <= end_ms."""
+        lo = bisect.bisect_left(self.actions, start_ms, key=_action_at)
+        hi = bisect.bisect_right(self.actions, end_ms, lo=lo, key=_action_at)
+        return lo, hi
 
     def remove_duplicates(self):
         """Remove actions at the same timestamp, keeping the last one."""
+        # Stable sort is linear on the (normally already) sorted list; then
+        # duplicates are adjacent and one scan keeps the last of each run
         self.sort_actions()
-        seen = {}
+        deduped = []
         for action in self.actions:
-            seen[action.at] = action
-        self.actions = list(seen.values())
-        self.sort_actions()
+            if deduped and deduped[-1].at == action.at:
+                deduped[-1] = action
+            else:
+                deduped.append(action)
+        self.actions[:] = deduped
+
+    def insert_action(self, action: FunscriptAction) -> int:
+        """Insert one action in timestamp order; returns its index."""
+        # bisect_right keeps it after equal timestamps, as append + sort did
+        idx = bisect.bisect_right(self.actions, action.at, key=_action_at)
+        self.actions.insert(idx, action)
+        self.mark_dirty()
+        return idx
+
+    def remove_action(self, idx: int) -> FunscriptAction:
+        """Remove and return the action at idx."""
+        action = self.actions.pop(idx)
+        self.mark_dirty()
+        return action
+
+    def move_action(self, idx: int, new_at: int, new_pos: int) -> int:
+        """
+        Move the action at idx to (new_at, new_pos), keeping the list sorted
+        without a full re-sort; returns its new index.  The action itself may
+        already hold new_at (the timeline edits it in place while dragging).
+        """
+        actions = self.actions
+        action = actions[idx]
+        action.pos = new_pos
+        last = len(actions) - 1
+        if idx > 0 and new_at < actions[idx - 1].at:
+            # Moved left past a neighbour: it lands after equal timestamps
+            del actions[idx]
+            action.at = new_at
+            idx = bisect.bisect_right(actions, new_at, hi=idx, key=_action_at)
+            actions.insert(idx, action)
+        elif idx < last and new_at > actions[idx + 1].at:
+            # Moved right past a neighbour: it lands before equal timestamps
+            del actions[idx]
+            action.at = new_at
+            idx = bisect.bisect_left(actions, new_at, lo=idx, key=_action_at)
+            actions.insert(idx, action)
+        else:
+            action.at = new_at  # still between its neighbours
+        self.mark_dirty()
+        return idx
 
     def get_actions_in_range(self, start_ms: int, end_ms: int) -> list[FunscriptAction]:
         """Get actions within a time range."""
-        return [a for a in self.actions if start_ms <= a.at <= end_ms]
+        lo, hi = self._range_bounds(start_ms, end_ms)
+        return self.actions[lo:hi]
 
     def remove_actions_in_range(self, start_ms: int, end_ms: int):
         """Remove all actions within a time range."""
-        self.actions = [a for a in self.actions if not (start_ms <= a.at <= end_ms)]
+        lo, hi = self._range_bounds(start_ms, end_ms)
+        del self.actions[lo:hi]
+        self.mark_dirty()
 
     def add_actions(self, new_actions: list[FunscriptAction]):
         """Add actions, replacing any existing ones in the same time range."""
         if not new_actions:
             return
-        start_ms = min(a.at for a in new_actions)
-        end_ms = max(a.at for a in new_actions)
-        self.remove_actions_in_range(start_ms, end_ms)
-        self.actions.extend(new_actions)
-        self.sort_actions()
+        new_sorted = sorted(new_actions, key=_action_at)
+        # Everything in [first, last] is replaced, so splice in one step
+        lo, hi = self._range_bounds(new_sorted[0].at, new_sorted[-1].at)
+        self.actions[lo:hi] = new_sorted
+        self.mark_dirty()
 
     def to_dict(self) -> dict:
         """Export as funscript JSON dict."""
@@ -142,38 +270,54 @@ class FunscriptProject:
             self.axes[axis_name] = FunscriptAxis(axis_name=axis_name)
         return self.axes[axis_name]
 
-    def export_funscript(self, output_dir: str, base_name: Optional[str] = None):
-        """
-        Export all axes as separate funscript files.
-        Returns list of exported file paths.
-        """
+    def _export_files(self, base_name: Optional[str]) -> Iterator[tuple[str, FunscriptAxis]]:
+        """Yield (funscript filename, axis) for every axis with actions."""
         if base_name is None:
             if self.video_path:
                 base_name = os.path.splitext(os.path.basename(self.video_path))[0]
             else:
                 base_name = "output"
 
-        exported = []
         for axis_name, axis_data in self.axes.items():
             if not axis_data.actions:
                 continue
 
             axis_def = AXIS_DEFINITIONS.get(axis_name, {"suffix": f".{axis_name}"})
             suffix = axis_def["suffix"]
-            filename = f"{base_name}{suffix}.funscript"
+            yield f"{base_name}{suffix}.funscript", axis_data
+
+    def export_funscript(self, output_dir: str, base_name: Optional[str] = None):
+        """
+        Export all axes as separate funscript files.
+        Returns list of exported file paths.
+        """
+        exported = []
+        for filename, axis_data in self._export_files(base_name):
             filepath = os.path.join(output_dir, filename)
+            _write_json(filepath, axis_data.to_dict())
+            exported.append(filepath)
 
-            with open(filepath, 'w') as f:
-                json.dump(axis_data.to_dict(), f, indent=2)
+        return exported
 
-            exported.append(filepath)
+    def export_funscript_zip(self, zip_path: str, base_name: Optional[str] = None):
+        """
+        Export all axes as funscript files inside one ZIP archive.
+        Each file is encoded and deflated straight into its archive entry.
+        Returns list of archive member names.
+        """
+        exported = []
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=6) as zf:
+            for filename, axis_data in self._export_files(base_name):
+                with zf.open(filename, 'w', force_zip64=True) as f:
+                    f.write(_dumps(axis_data.to_dict()))
+                exported.append(filename)
 
         return exported
 
     def import_funscript(self, filepath: str, axis_name: str = "stroke"):
         """Import a funscript file into the given axis."""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = _read_json(filepath)
         self.axes[axis_name] = FunscriptAxis.from_dict(axis_name, data)
 
     def save_project(self, filepath: str, extra_data: Optional[dict] = None):
@@ -182,16 +326,16 @@ class FunscriptProject:
         extra_data: optional dict of additional data to persist
                     (beat detection results, settings, etc.)
         """
-        project_data = {
-            "format": PROJECT_FORMAT,
-            "version": PROJECT_VERSION,
-            "video_path": self.video_path,
-            "axes": {name: axis.to_dict() for name, axis in self.axes.items()}
-        }
+        items = [
+            ("format", PROJECT_FORMAT),
+            ("version", PROJECT_VERSION),
+            ("video_path", self.video_path),
+            ("axes", ((name, axis.to_dict()) for name, axis in self.axes.items())),
+        ]
         if extra_data:
-            project_data["extra_data"] = extra_data
-        with open(filepath, 'w') as f:
-            json.dump(project_data, f, indent=2)
+            items.append(("extra_data", extra_data))
+        with open(filepath, 'wb') as f:
+            _write_json_stream(f, items)
 
     @classmethod
     def load_project(cls, filepath: str) -> tuple["FunscriptProject", dict]:
@@ -200,8 +344,7 @@ class FunscriptProject:
         Returns (project, extra_data) tuple.
         extra_data is an empty dict if none was saved.
         """
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = _read_json(filepath)
         project = cls(video_path=data.get("video_path"))
         for axis_name, axis_data in data.get("axes", {}).items():
             project.axes[axis_name] = FunscriptAxis.from_dict(axis_name, axis_data)
@@ -213,28 +356,25 @@ class FunscriptProject:
         Export a single combined bundle file containing all axes + metadata.
         This is a non-standard format for easy project sharing.
         """
-        bundle = {
-            "format": BUNDLE_FORMAT,
-            "version": BUNDLE_VERSION,
-            "video_path": self.video_path,
-            "axes": {}
-        }
-        for axis_name, axis_data in self.axes.items():
-            if axis_data.actions:
-                bundle["axes"][axis_name] = axis_data.to_dict()
+        items = [
+            ("format", BUNDLE_FORMAT),
+            ("version", BUNDLE_VERSION),
+            ("video_path", self.video_path),
+            ("axes", ((axis_name, axis_data.to_dict())
+                      for axis_name, axis_data in self.axes.items()
+                      if axis_data.actions)),
+        ]
         if extra_data:
-            bundle["extra_data"] = extra_data
-
-        with open(output_path, 'w') as f:
-            json.dump(bundle, f, indent=2)
+            items.append(("extra_data", extra_data))
+        with open(output_path, 'wb') as f:
+            _write_json_stream(f, items)
 
     @classmethod
     def import_bundle(cls, filepath: str) -> tuple["FunscriptProject", dict]:
         """
         Import a bundle file. Returns (project, extra_data).
         """
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = _read_json(filepath)
         project = cls(video_path=data.get("video_path"))
         for axis_name, axis_data in data.get("axes", {}).items():
             project.axes[axis_name] = FunscriptAxis.from_dict(axis_name, axis_data)
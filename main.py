@@ -16,9 +16,24 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QFile, QIODevice
 from main_window import MainWindow
 
+# Stylesheets ship next to this file (and inside the PyInstaller bundle)
+STYLE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_stylesheet(name: str) -> str:
+    """Read a .qss file from STYLE_DIR; empty string if it is missing."""
+    f = QFile(os.path.join(STYLE_DIR, name))
+    if not f.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
+        print(f"Stylesheet not found: {name}")
+        return ""
+    try:
+        return bytes(f.readAll()).decode("utf-8")
+    finally:
+        f.close()
+
 
 def main():
     app = QApplication(sys.argv)
@@ -26,153 +41,12 @@ def main():
     app.setOrganizationName("vFAPS")
 
     # Apply dark theme
-    app.setStyleSheet(DARK_STYLE)
+    app.setStyleSheet(load_stylesheet("dark.qss"))
 
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
 
 
-DARK_STYLE = """
-QMainWindow, QWidget {
-    background-color: #1e1e2e;
-    color: #cdd6f4;
-    font-family: 'Segoe UI', sans-serif;
-    font-size: 13px;
-}
-QMenuBar {
-    background-color: #181825;
-    color: #cdd6f4;
-    border-bottom: 1px solid #313244;
-}
-QMenuBar::item:selected {
-    background-color: #313244;
-}
-QMenu {
-    background-color: #1e1e2e;
-    color: #cdd6f4;
-    border: 1px solid #313244;
-}
-QMenu::item {
-    padding: 5px 28px 5px 20px;
-    min-width: 180px;
-}
-QMenu::item:selected {
-    background-color: #45475a;
-}
-QPushButton {
-    background-color: #313244;
-    color: #cdd6f4;
-    border: 1px solid #45475a;
-    border-radius: 4px;
-    padding: 6px 14px;
-    min-height: 20px;
-}
-QPushButton:hover {
-    background-color: #45475a;
-}
-QPushButton:pressed {
-    background-color: #585b70;
-}
-QPushButton:checked {
-    background-color: #89b4fa;
-    color: #1e1e2e;
-}
-QPushButton#recordBtn {
-    background-color: #45475a;
-    color: #f38ba8;
-    font-weight: bold;
-    border: 2px solid #f38ba8;
-}
-QPushButton#recordBtn:checked {
-    background-color: #f38ba8;
-    color: #1e1e2e;
-}
-QSlider::groove:horizontal {
-    height: 6px;
-    background: #313244;
-    border-radius: 3px;
-}
-QSlider::handle:horizontal {
-    background: #89b4fa;
-    width: 14px;
-    height: 14px;
-    margin: -4px 0;
-    border-radius: 7px;
-}
-QSlider::sub-page:horizontal {
-    background: #89b4fa;
-    border-radius: 3px;
-}
-QComboBox {
-    background-color: #313244;
-    color: #cdd6f4;
-    border: 1px solid #45475a;
-    border-radius: 4px;
-    padding: 4px 8px;
-}
-QComboBox::drop-down {
-    border: none;
-}
-QComboBox QAbstractItemView {
-    background-color: #1e1e2e;
-    color: #cdd6f4;
-    selection-background-color: #45475a;
-}
-QLabel {
-    color: #cdd6f4;
-}
-QLabel#statusLabel {
-    color: #a6adc8;
-    font-size: 12px;
-}
-QGroupBox {
-    border: 1px solid #313244;
-    border-radius: 6px;
-    margin-top: 8px;
-    padding-top: 16px;
-    font-weight: bold;
-}
-QGroupBox::title {
-    subcontrol-origin: margin;
-    left: 12px;
-    padding: 0 6px;
-}
-QSpinBox, QDoubleSpinBox {
-    background-color: #313244;
-    color: #cdd6f4;
-    border: 1px solid #45475a;
-    border-radius: 4px;
-    padding: 2px 6px;
-}
-QCheckBox::indicator {
-    width: 16px;
-    height: 16px;
-    border: 1px solid #45475a;
-    border-radius: 3px;
-    background-color: #313244;
-}
-QCheckBox::indicator:checked {
-    background-color: #89b4fa;
-    border-color: #89b4fa;
-}
-QScrollBar:vertical {
-    background: #181825;
-    width: 10px;
-}
-QScrollBar::handle:vertical {
-    background: #45475a;
-    border-radius: 5px;
-    min-height: 20px;
-}
-QToolTip {
-    background-color: #313244;
-    color: #cdd6f4;
-    border: 1px solid #45475a;
-    padding: 4px;
-}
-"""
-
-
 if __name__ == "__main__":
     main()
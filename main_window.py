@@ -13,18 +13,24 @@ Phase 1-7 enhancements:
   - Bundle export
 """
 
+import functools
+import importlib.util
 import os
 import sys
-import json
 import time
+from collections import deque
+from contextlib import ExitStack, contextmanager
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QSlider, QComboBox, QFileDialog, QMessageBox,
     QGroupBox, QSpinBox, QDoubleSpinBox, QCheckBox, QStatusBar,
-    QMenuBar, QMenu, QSplitter, QFrame, QToolTip, QApplication,
-    QScrollArea
+    QMenuBar, QMenu, QSplitter, QFrame, QToolTip,
+    QScrollArea, QProgressBar
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, pyqtSignal, QSize, QUrl, QObject, QRunnable, QThreadPool,
+    QSignalBlocker
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QSize, QUrl
 from PyQt6.QtGui import QAction, QKeySequence, QFont, QIcon, QMouseEvent, QDesktopServices
 
 from video_player import VideoPlayerWidget
@@ -33,15 +39,12 @@ from recorder import Recorder
 from timeline_widget import TimelineWidget
 from position_display import PositionDisplay, PositionDisplayOverlay
 from funscript_io import FunscriptProject, AXIS_DEFINITIONS, FunscriptAction
-from calibration_wizard import CalibrationWizard
 from controller_viz import ControllerVizPanel, ControllerVizOverlay
+from axis_toggle import AxisMultiToggle
 
-# Optional beat detection
-try:
-    from beat_detection import detect_beats, BeatData
-    HAS_BEAT_DETECTION = True
-except ImportError:
-    HAS_BEAT_DETECTION = False
+# Optional beat detection. The module itself is imported on first use:
+# loading it sets up pyfftw, whose plan cache starts a background thread.
+HAS_BEAT_DETECTION = importlib.util.find_spec("numpy") is not None
 
 # Axis overlay colors for multi-lane timeline
 AXIS_OVERLAY_COLORS = {
@@ -53,6 +56,47 @@ AXIS_OVERLAY_COLORS = {
     "pitch":  "#94e2d5",
 }
 
+# Stylesheets shared by the side panel widgets. The axis group carries the
+# rules for all of its buttons so Qt parses them once, not per button.
+_HINT_LABEL_QSS = "color: #a6adc8; font-size: 11px;"
+_MODE_LABEL_QSS = "color: #a6adc8; font-size: 11px; padding: 4px;"
+_AXES_GROUP_QSS = """
+    QPushButton#selectAllAxes { background: #313244; color: #a6adc8; border: none;
+        border-radius: 3px; font-size: 10px; }
+    QPushButton#selectAllAxes:hover { background: #45475a; color: #cdd6f4; }
+"""
+_BEAT_SNAP_APPLY_QSS = """
+    QPushButton { background: #313244; color: #f9e2af; border: 1px solid #45475a;
+        border-radius: 4px; padding: 3px 8px; font-size: 11px; }
+    QPushButton:hover { background: #45475a; }
+"""
+
+# Thumbstick deflection below which scrubbing is off
+THUMBSTICK_DEADZONE = 0.25
+
+# (label, value) choices for the settings combos; values ride along as item data
+_STAB_PRESETS = (("Off", "off"), ("Light", "light"), ("Medium", "medium"),
+                 ("Heavy", "heavy"))
+_PLAYBACK_SPEEDS = (("0.25x", 0.25), ("0.5x", 0.5), ("0.75x", 0.75),
+                    ("1.0x", 1.0), ("1.5x", 1.5), ("2.0x", 2.0))
+
+# (name, label, short label, description) per axis, derived once for UI builds
+_AXIS_TABLE = tuple(
+    (name, info["label"], info["label"].split(" ")[0], info["desc"])
+    for name, info in AXIS_DEFINITIONS.items()
+)
+# Axis names in _AXIS_TABLE order; bit i of the axis toggle masks is axis i
+_AXIS_NAMES = tuple(row[0] for row in _AXIS_TABLE)
+
+
+@contextmanager
+def _block_many(*objects):
+    """Block signals of several objects; each is restored even on error."""
+    with ExitStack() as stack:
+        for obj in objects:
+            stack.enter_context(QSignalBlocker(obj))
+        yield
+
 
 class VideoAreaWidget(QWidget):
     """Wrapper that captures mouse events over the video for fallback mode."""
@@ -74,9 +118,40 @@ class VideoAreaWidget(QWidget):
         super().mouseMoveEvent(event)
 
 
+class _BeatSignals(QObject):
+    """Signals for _BeatWorker; QRunnable itself cannot carry signals."""
+    finished = pyqtSignal(object)  # BeatData or None
+    failed = pyqtSignal(str)
+
+
+class _BeatWorker(QRunnable):
+    """Runs detect_beats on a pool thread and reports back via signals."""
+
+    def __init__(self, video_path: str):
+        super().__init__()
+        # The window holds the reference, so Qt must not delete the runnable
+        self.setAutoDelete(False)
+        self.video_path = video_path
+        self.signals = _BeatSignals()
+
+    def run(self):
+        try:
+            from beat_detection import detect_beats_cached
+            bd = detect_beats_cached(self.video_path)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(bd)
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    # Emitted from the controller polling thread, handled on the Qt thread
+    _controller_button = pyqtSignal(str)
+    _thumbstick_active = pyqtSignal(bool)
+    _controller_state_changed = pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("vFAPS")
@@ -94,14 +169,22 @@ class MainWindow(QMainWindow):
         self._calibrating = False       # True while calibration wizard is open
         self._viz_overlay = None         # Floating overlay widget (created lazily)
         self._pos_overlay = None         # Floating position display overlay
+        self._cal_wizard = None          # CalibrationWizard (created lazily)
+        self._state_event_pending = False  # controller update queued to Qt
+        self._posted_state = None        # last pose seen by the poll callback
+        self._refresh_pending = False    # timeline refresh queued this turn
+        self._rebuild_secondary_layout()
 
         # Phase 5: beat detection state
         self._beat_data = None           # BeatData from beat_detection module
+        self._beat_worker = None         # _BeatWorker while detection runs
 
         # Phase 3: overlay visibility state
         self._overlay_visible: dict[str, bool] = {}
         for ax_name in AXIS_DEFINITIONS:
             self._overlay_visible[ax_name] = False
+        # (list id, length, revision) last pushed to the timeline per overlay
+        self._overlay_cache: dict[str, tuple[int, int, int]] = {}
 
         # Initialize controller
         self._init_controller()
@@ -140,66 +223,85 @@ class MainWindow(QMainWindow):
     def _wire_controller_buttons(self):
         """
         Map physical controller buttons to app actions.
-        Button callbacks fire from the polling thread, so we use
-        thread-safe flags + QTimer to dispatch into the Qt main thread.
+        Button callbacks fire from the polling thread, so they only emit
+        signals; queued connections deliver them on the Qt main thread.
         """
-        self._btn_trigger_fired = False
-        self._btn_a_fired = False
-        self._btn_b_fired = False
-
-        def _on_trigger():
-            self._btn_trigger_fired = True
-
-        def _on_a_button():
-            self._btn_a_fired = True
-
-        def _on_b_button():
-            self._btn_b_fired = True
-
-        self.controller.on_button_press("trigger", _on_trigger)
-        self.controller.on_button_press("a_button", _on_a_button)
-        self.controller.on_button_press("b_button", _on_b_button)
-
-        self._btn_timer = QTimer(self)
-        self._btn_timer.setInterval(33)
-        self._btn_timer.timeout.connect(self._check_controller_buttons)
-        self._btn_timer.start()
-
-    def _check_controller_buttons(self):
-        """Called on the Qt thread to process controller button presses and joystick."""
-        if self._btn_trigger_fired:
-            self._btn_trigger_fired = False
+        self._controller_button.connect(
+            self._on_controller_button, Qt.ConnectionType.QueuedConnection)
+        self._thumbstick_active.connect(
+            self._on_thumbstick_active, Qt.ConnectionType.QueuedConnection)
+
+        for button in ("trigger", "a_button", "b_button"):
+            self.controller.on_button_press(
+                button, lambda b=button: self._controller_button.emit(b))
+
+        # Thumbstick scrubbing: the poll thread only reports deadzone
+        # crossings, and the scrub timer runs while the stick is held out
+        self._stick_active = False
+
+        def _on_poll(state):
+            active = abs(state.thumbstick_x) >= THUMBSTICK_DEADZONE
+            if active != self._stick_active:
+                self._stick_active = active
+                self._thumbstick_active.emit(active)
+
+        self.controller.add_callback(_on_poll)
+
+        self._stick_timer = QTimer(self)
+        self._stick_timer.setInterval(33)
+        self._stick_timer.timeout.connect(self._scrub_with_thumbstick)
+
+        # Scrub deltas are summed and applied as one backend seek per flush
+        self._pending_seek_delta = 0
+        self._seek_flush_timer = QTimer(self)
+        self._seek_flush_timer.setSingleShot(True)
+        self._seek_flush_timer.setInterval(16)
+        self._seek_flush_timer.timeout.connect(self._flush_seek)
+
+    def _on_controller_button(self, button: str):
+        """Called on the Qt thread for each controller button press."""
+        if button == "trigger":
             if self._calibrating:
                 # Trigger also confirms during calibration (more reliable than A)
                 self._cal_wizard.confirm_via_controller()
             else:
                 self._toggle_recording()
-
-        if self._btn_a_fired:
-            self._btn_a_fired = False
+        elif button == "a_button":
             if self._calibrating:
                 self._cal_wizard.confirm_via_controller()
             else:
                 self._auto_calibrate()
-
-        if self._btn_b_fired:
-            self._btn_b_fired = False
+        elif button == "b_button":
             if self._calibrating:
                 self._cal_wizard.go_back_via_controller()
             else:
                 self._recenter_controller()
 
-        # Thumbstick scrubbing
+    def _on_thumbstick_active(self, active: bool):
+        if active:
+            self._stick_timer.start()
+        else:
+            self._stick_timer.stop()
+
+    def _scrub_with_thumbstick(self):
+        """Seek proportionally to thumbstick deflection (Qt thread)."""
         state = self.controller.get_current_state()
         stick_x = state.thumbstick_x
-        deadzone = 0.25
+        deadzone = THUMBSTICK_DEADZONE
         if abs(stick_x) < deadzone:
             return
         sign = 1 if stick_x > 0 else -1
         magnitude = (abs(stick_x) - deadzone) / (1.0 - deadzone)
         speed = magnitude * magnitude
         seek_delta_ms = int(sign * (30 + speed * 300))
-        self.video_player.seek_relative(seek_delta_ms)
+        self._pending_seek_delta += seek_delta_ms
+        if not self._seek_flush_timer.isActive():
+            self._seek_flush_timer.start()
+
+    def _flush_seek(self):
+        delta, self._pending_seek_delta = self._pending_seek_delta, 0
+        if delta:
+            self.video_player.seek_relative(delta)
 
     # ================================================================
     #  MENU BAR
@@ -352,11 +454,12 @@ class MainWindow(QMainWindow):
         overlay_menu.addSeparator()
 
         self._overlay_actions: dict[str, QAction] = {}
-        for ax_name, ax_info in AXIS_DEFINITIONS.items():
-            action = QAction(ax_info["label"], self)
+        for ax_name, ax_label, _, _ in _AXIS_TABLE:
+            action = QAction(ax_label, self)
             action.setCheckable(True)
             action.setChecked(False)
-            action.toggled.connect(lambda checked, name=ax_name: self._on_overlay_toggled(name, checked))
+            action.setProperty("axis_name", ax_name)
+            action.toggled.connect(self._on_overlay_action_toggled)
             overlay_menu.addAction(action)
             self._overlay_actions[ax_name] = action
 
@@ -364,9 +467,9 @@ class MainWindow(QMainWindow):
         tools_menu = menubar.addMenu("&Tools")
 
         if HAS_BEAT_DETECTION:
-            detect_beats_action = QAction("Detect &Beats from Audio...", self)
-            detect_beats_action.triggered.connect(self._detect_beats)
-            tools_menu.addAction(detect_beats_action)
+            self._detect_beats_action = QAction("Detect &Beats from Audio...", self)
+            self._detect_beats_action.triggered.connect(self._detect_beats)
+            tools_menu.addAction(self._detect_beats_action)
 
             self._beats_visible_action = QAction("Show Beat &Markers", self)
             self._beats_visible_action.setShortcut(QKeySequence("Ctrl+B"))
@@ -428,7 +531,8 @@ class MainWindow(QMainWindow):
 
         if self._use_mouse_fallback:
             self._video_area.set_tracking_enabled(True)
-            self._video_area.mouse_moved.connect(self._on_mouse_moved)
+            self._video_area.mouse_moved.connect(
+                self._on_mouse_moved, Qt.ConnectionType.DirectConnection)
 
         top_splitter.addWidget(self._video_area)
 
@@ -450,6 +554,7 @@ class MainWindow(QMainWindow):
 
         # --- Phase 2: Axis Selector with Lock buttons ---
         axis_group = QGroupBox("Axes")
+        axis_group.setStyleSheet(_AXES_GROUP_QSS)
         axis_layout = QVBoxLayout(axis_group)
         axis_layout.setSpacing(3)
 
@@ -457,63 +562,34 @@ class MainWindow(QMainWindow):
         combo_row = QHBoxLayout()
         combo_row.addWidget(QLabel("Edit:"))
         self.axis_combo = QComboBox()
-        for name, info in AXIS_DEFINITIONS.items():
-            self.axis_combo.addItem(info["label"], name)
+        for name, label, _, _ in _AXIS_TABLE:
+            self.axis_combo.addItem(label, name)
         self.axis_combo.currentIndexChanged.connect(self._on_axis_changed)
         combo_row.addWidget(self.axis_combo, 1)
         axis_layout.addLayout(combo_row)
 
-        # Per-axis: record checkbox + lock button
-        self._axis_checks: dict[str, QCheckBox] = {}
-        self._axis_lock_btns: dict[str, QPushButton] = {}
-
+        # Per-axis record checkboxes and lock toggles, painted as one widget
         rec_header = QHBoxLayout()
         axis_label = QLabel("Record / Lock:")
-        axis_label.setStyleSheet("color: #a6adc8; font-size: 11px;")
+        axis_label.setStyleSheet(_HINT_LABEL_QSS)
         rec_header.addWidget(axis_label)
         rec_header.addStretch()
 
         self._select_all_axes_btn = QPushButton("All")
         self._select_all_axes_btn.setFixedSize(36, 20)
         self._select_all_axes_btn.setToolTip("Select all / none for recording")
-        self._select_all_axes_btn.setStyleSheet("""
-            QPushButton { background: #313244; color: #a6adc8; border: none;
-                border-radius: 3px; font-size: 10px; }
-            QPushButton:hover { background: #45475a; color: #cdd6f4; }
-        """)
+        self._select_all_axes_btn.setObjectName("selectAllAxes")
         self._select_all_axes_btn.clicked.connect(self._toggle_all_record_axes)
         rec_header.addWidget(self._select_all_axes_btn)
 
         axis_layout.addLayout(rec_header)
 
-        lock_btn_style = """
-            QPushButton { background: #313244; color: #a6adc8; border: none;
-                border-radius: 3px; font-size: 12px; min-width: 22px; max-width: 22px;
-                min-height: 22px; max-height: 22px; }
-            QPushButton:hover { background: #45475a; }
-            QPushButton:checked { background: #f38ba8; color: #1e1e2e; }
-        """
-
-        for name, info in AXIS_DEFINITIONS.items():
-            row = QHBoxLayout()
-            row.setSpacing(4)
-
-            cb = QCheckBox(info["label"].split(" ")[0])
-            cb.setChecked(name == "stroke")
-            cb.setToolTip(f"Record {info['desc']} axis")
-            cb.toggled.connect(self._on_multi_axis_changed)
-            self._axis_checks[name] = cb
-            row.addWidget(cb, 1)
-
-            lock_btn = QPushButton("\U0001F513")  # unlocked icon
-            lock_btn.setCheckable(True)
-            lock_btn.setToolTip(f"Lock {info['label'].split(' ')[0]} axis")
-            lock_btn.setStyleSheet(lock_btn_style)
-            lock_btn.toggled.connect(lambda checked, ax=name: self._on_axis_lock_toggled(ax, checked))
-            self._axis_lock_btns[name] = lock_btn
-            row.addWidget(lock_btn)
-
-            axis_layout.addLayout(row)
+        self._axis_toggle = AxisMultiToggle(
+            [(name, short_label, desc) for name, _, short_label, desc in _AXIS_TABLE],
+            record_mask=1 << _AXIS_NAMES.index("stroke"))
+        self._axis_toggle.mask_changed.connect(self._on_axis_masks_changed)
+        self._lock_mask = 0
+        axis_layout.addWidget(self._axis_toggle)
 
         right_layout.addWidget(axis_group)
 
@@ -526,10 +602,11 @@ class MainWindow(QMainWindow):
         stab_layout = QHBoxLayout()
         stab_layout.addWidget(QLabel("Stab:"))
         self.stab_combo = QComboBox()
-        self.stab_combo.addItems(["Off", "Light", "Medium", "Heavy"])
+        for label, preset in _STAB_PRESETS:
+            self.stab_combo.addItem(label, preset)
         self.stab_combo.setCurrentIndex(2)  # Default: Medium
         self.stab_combo.setToolTip("Realtime stabilization preset")
-        self.stab_combo.currentTextChanged.connect(self._on_stabilization_changed)
+        self.stab_combo.currentIndexChanged.connect(self._on_stabilization_changed)
         stab_layout.addWidget(self.stab_combo, 1)
         settings_layout.addLayout(stab_layout)
 
@@ -555,10 +632,10 @@ class MainWindow(QMainWindow):
         speed_layout = QHBoxLayout()
         speed_layout.addWidget(QLabel("Speed:"))
         self.speed_combo = QComboBox()
-        for spd in ["0.25x", "0.5x", "0.75x", "1.0x", "1.5x", "2.0x"]:
-            self.speed_combo.addItem(spd)
+        for label, speed in _PLAYBACK_SPEEDS:
+            self.speed_combo.addItem(label, speed)
         self.speed_combo.setCurrentIndex(3)  # 1.0x
-        self.speed_combo.currentTextChanged.connect(self._on_speed_changed)
+        self.speed_combo.currentIndexChanged.connect(self._on_speed_changed)
         speed_layout.addWidget(self.speed_combo)
         settings_layout.addLayout(speed_layout)
 
@@ -569,12 +646,13 @@ class MainWindow(QMainWindow):
         self.sens_slider.setRange(50, 300)
         self.sens_slider.setValue(100)
         self.sens_slider.setToolTip("Adjust controller sensitivity (0.5x to 3.0x)")
-        self.sens_slider.valueChanged.connect(self._on_sensitivity_changed)
+        self.sens_slider.valueChanged.connect(
+            self._on_sensitivity_changed, Qt.ConnectionType.DirectConnection)
         sens_layout.addWidget(self.sens_slider)
 
         self.sens_label = QLabel("1.0x")
         self.sens_label.setFixedWidth(35)
-        self.sens_label.setStyleSheet("color: #a6adc8; font-size: 11px;")
+        self.sens_label.setStyleSheet(_HINT_LABEL_QSS)
         sens_layout.addWidget(self.sens_label)
         settings_layout.addLayout(sens_layout)
 
@@ -588,12 +666,13 @@ class MainWindow(QMainWindow):
             "Beat snap strength (0% = freehand, 100% = fully quantized)\n"
             "Blends each point's timing between its original position\n"
             "and the nearest beat. Use Apply to apply to data.")
-        self.beat_snap_slider.valueChanged.connect(self._on_beat_snap_changed)
+        self.beat_snap_slider.valueChanged.connect(
+            self._on_beat_snap_changed, Qt.ConnectionType.DirectConnection)
         beat_snap_layout.addWidget(self.beat_snap_slider)
 
         self.beat_snap_label = QLabel("0%")
         self.beat_snap_label.setFixedWidth(35)
-        self.beat_snap_label.setStyleSheet("color: #a6adc8; font-size: 11px;")
+        self.beat_snap_label.setStyleSheet(_HINT_LABEL_QSS)
         beat_snap_layout.addWidget(self.beat_snap_label)
         settings_layout.addLayout(beat_snap_layout)
 
@@ -602,11 +681,7 @@ class MainWindow(QMainWindow):
         self.beat_snap_apply_btn.setToolTip(
             "Apply beat snap to selected range (or all points).\n"
             "Slider controls how tightly points follow the beat grid.")
-        self.beat_snap_apply_btn.setStyleSheet("""
-            QPushButton { background: #313244; color: #f9e2af; border: 1px solid #45475a;
-                border-radius: 4px; padding: 3px 8px; font-size: 11px; }
-            QPushButton:hover { background: #45475a; }
-        """)
+        self.beat_snap_apply_btn.setStyleSheet(_BEAT_SNAP_APPLY_QSS)
         self.beat_snap_apply_btn.clicked.connect(self._apply_beat_snap)
         settings_layout.addWidget(self.beat_snap_apply_btn)
 
@@ -620,7 +695,7 @@ class MainWindow(QMainWindow):
             mode_label = QLabel("\U0001F3AE VR Controller")
         else:
             mode_label = QLabel("\U0001F5B1 Mouse Fallback")
-        mode_label.setStyleSheet("color: #a6adc8; font-size: 11px; padding: 4px;")
+        mode_label.setStyleSheet(_MODE_LABEL_QSS)
         mode_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         right_layout.addWidget(mode_label)
 
@@ -639,12 +714,6 @@ class MainWindow(QMainWindow):
         self.timeline = TimelineWidget()
         main_layout.addWidget(self.timeline, 1)
 
-        # Calibration wizard overlay (initially hidden)
-        self._cal_wizard = CalibrationWizard(self.controller, central)
-        self._cal_wizard.hide()
-        self._cal_wizard.calibration_finished.connect(self._apply_calibration)
-        self._cal_wizard.calibration_cancelled.connect(self._on_cal_cancelled)
-
     # ================================================================
     #  TRANSPORT CONTROLS
     # ================================================================
@@ -659,6 +728,7 @@ class MainWindow(QMainWindow):
 
         # Time display
         self.time_label = QLabel("00:00.0 / 00:00.0")
+        self._time_label_text = self.time_label.text()
         self.time_label.setFont(QFont("Consolas", 11))
         self.time_label.setStyleSheet("color: #cdd6f4; min-width: 160px;")
         layout.addWidget(self.time_label)
@@ -717,7 +787,7 @@ class MainWindow(QMainWindow):
         self.seek_slider.setRange(0, 1000)
         self.seek_slider.sliderPressed.connect(self._on_seek_start)
         self.seek_slider.sliderReleased.connect(self._on_seek_end)
-        self.seek_slider.sliderMoved.connect(self._on_seek_moved)
+        self.seek_slider.sliderMoved.connect(self._on_seek_moved, Qt.ConnectionType.DirectConnection)
         self._seeking = False
         layout.addWidget(self.seek_slider, 1)
 
@@ -750,10 +820,26 @@ class MainWindow(QMainWindow):
         self._actions_label.setObjectName("statusLabel")
         self.status_bar.addPermanentWidget(self._actions_label)
 
-        self._backend_label = QLabel("")
+        # The video backend and the input device are fixed at startup
+        if not self._use_mouse_fallback and hasattr(self.controller, 'get_controller_name'):
+            input_mode = self.controller.get_controller_name()
+        elif not self._use_mouse_fallback:
+            input_mode = "VR"
+        else:
+            input_mode = "Mouse"
+        self._backend_label = QLabel(
+            f"Video: {self.video_player.get_backend_name()} | Input: {input_mode}")
         self._backend_label.setObjectName("statusLabel")
         self.status_bar.addPermanentWidget(self._backend_label)
 
+        # Indeterminate bar shown while background work runs
+        self._busy_bar = QProgressBar()
+        self._busy_bar.setRange(0, 0)
+        self._busy_bar.setMaximumWidth(120)
+        self._busy_bar.setTextVisible(False)
+        self._busy_bar.hide()
+        self.status_bar.addPermanentWidget(self._busy_bar)
+
     # ================================================================
     #  SHORTCUTS & TIMERS & SIGNALS
     # ================================================================
@@ -795,29 +881,67 @@ class MainWindow(QMainWindow):
 
     def _setup_timers(self):
         """Set up periodic update timers."""
+        # Labels, playhead and position displays follow their own signals;
+        # only the recording buffer preview is refreshed on a timer, and
+        # only while a take is running
         self._ui_timer = QTimer(self)
         self._ui_timer.setInterval(33)
-        self._ui_timer.timeout.connect(self._update_ui)
-        self._ui_timer.start()
-
+        self._ui_timer.timeout.connect(self._update_buffer_preview)
+
+        # While recording, the controller poll thread queues every tracked
+        # pose with its capture time; the record timer drains the queue and
+        # hands the recorder one batch per tick
+        self._sample_queue = deque(maxlen=8192)
+        self._record_floor_ms = 0
+        self.controller.add_callback(self._capture_sample)
         self._record_timer = QTimer(self)
-        self._record_timer.setInterval(11)
+        self._record_timer.setInterval(16)
         self._record_timer.timeout.connect(self._record_sample)
 
         self._autosave_timer = QTimer(self)
         self._autosave_timer.setInterval(60000)
         self._autosave_timer.timeout.connect(self._autosave)
 
+        # Slider drags report every tick; only the latest value per handler
+        # is applied when this fires
+        self._pending_slider_values = {}
+        self._slider_debounce = QTimer(self)
+        self._slider_debounce.setSingleShot(True)
+        self._slider_debounce.setInterval(30)
+        self._slider_debounce.timeout.connect(self._flush_slider_values)
+
+    def _defer_slider(self, apply, value: int):
+        """Queue a slider value for ``apply`` on the next debounce flush."""
+        self._pending_slider_values[apply] = value
+        if not self._slider_debounce.isActive():
+            self._slider_debounce.start()
+
+    def _flush_slider_values(self):
+        pending, self._pending_slider_values = self._pending_slider_values, {}
+        for apply, value in pending.items():
+            apply(value)
+
     def _connect_signals(self):
         """Connect inter-component signals."""
-        self.video_player.time_changed.connect(self._on_time_changed)
+        # High-rate signals emitted on the GUI thread connect directly,
+        # skipping the per-emit thread check. duration/state changes can come
+        # from mpv's observer thread, so they keep automatic connections.
+        direct = Qt.ConnectionType.DirectConnection
+        self.video_player.time_changed.connect(self._on_time_tick, direct)
         self.video_player.duration_changed.connect(self._on_duration_changed)
         self.video_player.state_changed.connect(self._on_state_changed)
+        # A gated seek can land after the slider released; resync the views
+        self.video_player.seeked.connect(self._on_seeked)
 
-        self.timeline.seek_requested.connect(self._on_timeline_seek)
+        # Pose updates arrive from the controller poll thread
+        self._controller_state_changed.connect(
+            self._on_controller_state, Qt.ConnectionType.QueuedConnection)
+        self.controller.add_callback(self._post_controller_state)
+
+        self.timeline.seek_requested.connect(self._on_timeline_seek, direct)
         self.timeline.clear_range_requested.connect(self._on_clear_range)
 
-        self.timeline.point_moved.connect(self._on_point_moved)
+        self.timeline.point_moved.connect(self._on_point_moved, direct)
         self.timeline.point_deleted.connect(self._on_point_deleted)
         self.timeline.point_added.connect(self._on_point_added)
         self.timeline.points_modified.connect(self._on_points_modified)
@@ -826,17 +950,30 @@ class MainWindow(QMainWindow):
     #  SIGNAL HANDLERS
     # ================================================================
 
-    def _on_time_changed(self, time_ms: int):
+    def _on_time_tick(self, time_ms: int):
+        # Nothing is on screen while minimized; showEvent resyncs on restore
+        if self._seeking or self.isMinimized() or not self.isVisible():
+            return
+        dur = self.video_player.get_duration_ms()
+        self._set_time_label(time_ms, dur)
         self.timeline.set_playhead(time_ms)
-        if not self._seeking:
-            dur = self.video_player.get_duration_ms()
-            if dur > 0:
-                self.seek_slider.blockSignals(True)
+        if dur > 0:
+            with QSignalBlocker(self.seek_slider):
                 self.seek_slider.setValue(int(time_ms / dur * 1000))
-                self.seek_slider.blockSignals(False)
+
+    def _set_time_label(self, time_ms: int, duration_ms: int):
+        # The label shows tenths of a second; most ticks format the same text
+        text = f"{self._format_time(time_ms)} / {self._format_time(duration_ms)}"
+        if text != self._time_label_text:
+            self._time_label_text = text
+            self.time_label.setText(text)
 
     def _on_duration_changed(self, duration_ms: int):
         self.timeline.set_duration(duration_ms)
+        self._on_time_tick(self.video_player.get_time_ms())
+
+    def _on_seeked(self):
+        self._on_time_tick(self.video_player.get_time_ms())
 
     def _on_state_changed(self, state: str):
         if state == "playing":
@@ -853,14 +990,18 @@ class MainWindow(QMainWindow):
         self._seeking = True
 
     def _on_seek_moved(self, value):
+        self._defer_slider(self._preview_seek, value)
+
+    def _preview_seek(self, value: int):
         dur = self.video_player.get_duration_ms()
         if dur > 0:
             time_ms = int(value / 1000 * dur)
-            self.time_label.setText(
-                f"{self._format_time(time_ms)} / {self._format_time(dur)}")
+            self._set_time_label(time_ms, dur)
             self.timeline.set_playhead(time_ms)
 
     def _on_seek_end(self):
+        # The release seeks to the final value, so a queued preview is stale
+        self._pending_slider_values.pop(self._preview_seek, None)
         dur = self.video_player.get_duration_ms()
         if dur > 0:
             time_ms = int(self.seek_slider.value() / 1000 * dur)
@@ -881,72 +1022,87 @@ class MainWindow(QMainWindow):
     def _on_point_moved(self, idx: int, new_at: int, new_pos: int):
         axis = self.project.get_axis(self._active_axis)
         if 0 <= idx < len(axis.actions):
-            axis.actions[idx].at = new_at
-            axis.actions[idx].pos = new_pos
-            axis.sort_actions()
+            axis.move_action(idx, new_at, new_pos)
         self._refresh_timeline()
         self._update_status(f"Point moved to {self._format_time(new_at)}, pos {new_pos}")
 
     def _on_point_deleted(self, idx: int):
         axis = self.project.get_axis(self._active_axis)
         if 0 <= idx < len(axis.actions):
-            removed = axis.actions.pop(idx)
+            removed = axis.remove_action(idx)
             self._refresh_timeline()
             self._update_status(f"Point deleted at {self._format_time(removed.at)}")
 
     def _on_point_added(self, at_ms: int, pos: int):
         axis = self.project.get_axis(self._active_axis)
-        new_action = FunscriptAction(at=at_ms, pos=pos)
-        axis.actions.append(new_action)
-        axis.sort_actions()
+        axis.insert_action(FunscriptAction(at=at_ms, pos=pos))
         self._refresh_timeline()
         self._update_status(f"Point added at {self._format_time(at_ms)}, pos {pos}")
 
     def _on_points_modified(self):
-        axis = self.project.get_axis(self._active_axis)
-        axis.sort_actions()
+        # Generic in-place edit notification; edits keep the list sorted
+        self.project.get_axis(self._active_axis).mark_dirty()
         self._refresh_timeline()
 
     # ---- Axis / settings handlers ----
 
     def _on_axis_changed(self, index):
         self._active_axis = self.axis_combo.currentData()
+        self._rebuild_secondary_layout()
         axis_def = AXIS_DEFINITIONS.get(self._active_axis, {})
         label = axis_def.get("label", self._active_axis)
         self.position_display.set_axis_label(label)
         if self._pos_overlay and self._pos_overlay.isVisible():
             self._pos_overlay.set_axis_label(label)
+        self._on_controller_state()
         self._refresh_timeline()
 
+    def _rebuild_secondary_layout(self):
+        """(axis, controller axis) for every non-active axis, plus the dict
+        the position displays read secondary positions from."""
+        self._secondary_layout = [
+            (name, info.get("controller_axis", "y"))
+            for name, info in AXIS_DEFINITIONS.items()
+            if name != self._active_axis]
+        self._secondary_buf = {name: 50 for name, _ in self._secondary_layout}
+        self._primary_ctrl_axis = AXIS_DEFINITIONS.get(
+            self._active_axis, {}).get("controller_axis", "y")
+        # The new dict has to reach the displays
+        self._pos_panel_key = self._pos_overlay_key = None
+
+    def _on_axis_masks_changed(self, record_mask: int, lock_mask: int):
+        """Apply record/lock bits from the axis toggle widget."""
+        self._on_multi_axis_changed()
+        changed = lock_mask ^ self._lock_mask
+        self._lock_mask = lock_mask
+        for i, name in enumerate(_AXIS_NAMES):
+            if changed >> i & 1:
+                self._on_axis_lock_toggled(name, bool(lock_mask >> i & 1))
+
     def _on_multi_axis_changed(self):
-        active = set()
-        for name, cb in self._axis_checks.items():
-            if cb.isChecked():
-                active.add(name)
+        mask = self._axis_toggle.record_mask()
+        active = {name for i, name in enumerate(_AXIS_NAMES) if mask >> i & 1}
         if not active:
             active.add("stroke")
         self.recorder.active_axes = active
 
     def _toggle_all_record_axes(self):
         """Toggle all recording axis checkboxes on/off."""
-        all_checked = all(cb.isChecked() for cb in self._axis_checks.values())
-        for cb in self._axis_checks.values():
-            cb.blockSignals(True)
-            cb.setChecked(not all_checked)
-            cb.blockSignals(False)
-        # Ensure at least stroke if we just unchecked everything
-        if all_checked:
-            self._axis_checks["stroke"].blockSignals(True)
-            self._axis_checks["stroke"].setChecked(True)
-            self._axis_checks["stroke"].blockSignals(False)
+        all_mask = (1 << len(_AXIS_NAMES)) - 1
+        all_checked = self._axis_toggle.record_mask() == all_mask
+        # Unchecking everything still leaves stroke selected
+        self._axis_toggle.set_record_mask(
+            1 << _AXIS_NAMES.index("stroke") if all_checked else all_mask)
         self._on_multi_axis_changed()
         self._select_all_axes_btn.setText("None" if not all_checked else "All")
 
-    def _on_speed_changed(self, text: str):
-        speed = float(text.replace("x", ""))
-        self.video_player.set_speed(speed)
+    def _on_speed_changed(self, index: int):
+        self.video_player.set_speed(self.speed_combo.itemData(index))
 
     def _on_sensitivity_changed(self, value: int):
+        self._defer_slider(self._apply_sensitivity, value)
+
+    def _apply_sensitivity(self, value: int):
         scale = value / 100.0
         self.sens_label.setText(f"{scale:.1f}x")
         if self.controller:
@@ -958,52 +1114,46 @@ class MainWindow(QMainWindow):
 
     # ---- Phase 1: Stabilization handler ----
 
-    def _on_stabilization_changed(self, text: str):
-        preset = text.lower()
+    def _on_stabilization_changed(self, index: int):
         if self.controller:
-            self.controller.set_stabilization_preset(preset)
-        self._update_status(f"Stabilization: {text}")
+            self.controller.set_stabilization_preset(self.stab_combo.itemData(index))
+        self._update_status(f"Stabilization: {self.stab_combo.itemText(index)}")
 
     # ---- Phase 2: Axis lock handler ----
 
     def _on_axis_lock_toggled(self, axis_name: str, locked: bool):
         """Toggle axis lock on the controller."""
-        btn = self._axis_lock_btns.get(axis_name)
         if locked:
             self.controller.lock_axis(axis_name)
-            if btn:
-                btn.setText("\U0001F512")  # locked icon
-                btn.setToolTip(f"Unlock {axis_name}")
         else:
             self.controller.unlock_axis(axis_name)
-            if btn:
-                btn.setText("\U0001F513")  # unlocked icon
-                btn.setToolTip(f"Lock {axis_name}")
 
     # ---- Phase 3: Overlay toggles ----
 
+    def _on_overlay_action_toggled(self, visible: bool):
+        """Shared slot for the per-axis overlay menu actions."""
+        self._on_overlay_toggled(self.sender().property("axis_name"), visible)
+
     def _on_overlay_toggled(self, axis_name: str, visible: bool):
         """Toggle visibility of an axis overlay lane on the timeline."""
         self._overlay_visible[axis_name] = visible
-        self._refresh_timeline()
+        self.timeline.set_overlay_visibility(axis_name, visible)
 
     def _show_all_overlays(self):
         """Show all axis overlays on the timeline."""
-        for ax_name, action in self._overlay_actions.items():
-            action.blockSignals(True)
-            action.setChecked(True)
-            action.blockSignals(False)
-            self._overlay_visible[ax_name] = True
-        self._refresh_timeline()
+        with _block_many(*self._overlay_actions.values()):
+            for ax_name, action in self._overlay_actions.items():
+                action.setChecked(True)
+                self._overlay_visible[ax_name] = True
+                self.timeline.set_overlay_visibility(ax_name, True)
 
     def _hide_all_overlays(self):
         """Hide all axis overlays on the timeline."""
-        for ax_name, action in self._overlay_actions.items():
-            action.blockSignals(True)
-            action.setChecked(False)
-            action.blockSignals(False)
-            self._overlay_visible[ax_name] = False
-        self._refresh_timeline()
+        with _block_many(*self._overlay_actions.values()):
+            for ax_name, action in self._overlay_actions.items():
+                action.setChecked(False)
+                self._overlay_visible[ax_name] = False
+                self.timeline.set_overlay_visibility(ax_name, False)
 
     # ---- Phase 4: Heatmap toggle ----
 
@@ -1027,6 +1177,9 @@ class MainWindow(QMainWindow):
 
         current_time = self.video_player.get_time_ms()
         self.recorder.start_recording(current_time)
+        self._sample_queue.clear()
+        # Backdated poses must not land before the take (or before 0)
+        self._record_floor_ms = max(0, current_time)
         self._recording_active = True
         self.record_btn.setChecked(True)
         self.record_btn.setText("\u23F9 STOP")
@@ -1036,6 +1189,7 @@ class MainWindow(QMainWindow):
             self._pos_overlay.set_recording(True)
 
         self._record_timer.start()
+        self._ui_timer.start()
 
         if not self.video_player.is_playing():
             self.video_player.play()
@@ -1044,6 +1198,8 @@ class MainWindow(QMainWindow):
 
     def _stop_recording(self):
         self._record_timer.stop()
+        self._ui_timer.stop()
+        self._record_sample()  # commit poses captured since the last tick
         segments = self.recorder.stop_recording()
         self._recording_active = False
         self.record_btn.setChecked(False)
@@ -1066,6 +1222,7 @@ class MainWindow(QMainWindow):
         if not self._recording_active:
             return
         self._record_timer.stop()
+        self._ui_timer.stop()
         self.recorder.cancel_recording()
         self._recording_active = False
         self.record_btn.setChecked(False)
@@ -1077,120 +1234,168 @@ class MainWindow(QMainWindow):
             self._pos_overlay.set_recording(False)
         self._update_status("Recording cancelled.")
 
+    def _capture_sample(self, state):
+        """Controller poll callback (poll thread): queue a pose while recording."""
+        if self._recording_active and state.is_tracked:
+            self._sample_queue.append((time.perf_counter(), state.mapped))
+
     def _record_sample(self):
+        """Drain queued poses into the recorder, stamped with video time."""
         if not self._recording_active:
             return
-        state = self.controller.get_current_state()
-        if not state.is_tracked:
+        queue = self._sample_queue
+        count = len(queue)
+        if not count:
             return
-        video_time = self.video_player.get_time_ms()
-        self.recorder.add_sample(video_time, state.mapped)
+        now = time.perf_counter()
+        video_now = self.video_player.get_time_ms()
+        # Place each pose on the video timeline by how long ago it was
+        # captured; while paused the video clock stands still
+        ms_per_s = 1000.0 * self.video_player.get_speed() \
+            if self.video_player.is_playing() else 0.0
+        # The video clock is only refreshed on each player poll, so on the
+        # first ticks of a take the backdated time can precede its start
+        floor = self._record_floor_ms
+        batch = []
+        for _ in range(count):
+            captured, mapped = queue.popleft()
+            at = video_now - int((now - captured) * ms_per_s)
+            batch.append((at if at > floor else floor, mapped))
+        self.recorder.add_samples(batch)
 
     # ================================================================
     #  UI UPDATES
     # ================================================================
 
-    def _update_ui(self):
-        """Periodic UI update (called at ~30fps)."""
-        current = self.video_player.get_time_ms()
-        duration = self.video_player.get_duration_ms()
-        self.time_label.setText(
-            f"{self._format_time(current)} / {self._format_time(duration)}")
-
-        if not self._seeking:
-            self.timeline.set_playhead(current)
-
-        if not self._seeking and duration > 0:
-            slider_val = int(current / duration * 1000)
-            if abs(self.seek_slider.value() - slider_val) > 1:
-                self.seek_slider.blockSignals(True)
-                self.seek_slider.setValue(slider_val)
-                self.seek_slider.blockSignals(False)
+    def _post_controller_state(self, state):
+        """Controller poll callback (poll thread): wake the Qt thread on a new pose."""
+        # The mouse fallback hands back the same state object until the
+        # mouse moves, so an idle controller posts nothing. At most one
+        # update is queued at a time; the handler reads the latest state,
+        # so poses arriving in between are coalesced
+        if state is self._posted_state:
+            return
+        self._posted_state = state
+        if not self._state_event_pending:
+            self._state_event_pending = True
+            self._controller_state_changed.emit()
+
+    def _on_controller_state(self):
+        """Push the latest controller pose into the position and 3D displays."""
+        self._state_event_pending = False
+        if self.isMinimized() or not self.isVisible():
+            return
 
-        # Update position display from controller
+        # Only displays that are on screen are fed, and each one only when
+        # what it shows (tracked flag, primary and secondary positions)
+        # differs from what it was last given
+        panel = self.position_display
+        panel_visible = panel.isVisible()
+        pos_ol = self._pos_overlay
+        pos_ol_visible = pos_ol is not None and pos_ol.isVisible()
         state = self.controller.get_current_state()
-        self.position_display.set_tracked(state.is_tracked)
-
-        _pos_ol = self._pos_overlay
-        _pos_visible = _pos_ol is not None and _pos_ol.isVisible()
-        if _pos_visible:
-            _pos_ol.set_tracked(state.is_tracked)
-
-        if state.is_tracked and state.mapped:
-            axis_def = AXIS_DEFINITIONS.get(self._active_axis, {})
-            ctrl_axis = axis_def.get("controller_axis", "y")
-            primary_pos = state.mapped.get(ctrl_axis, 50)
-            self.position_display.set_position(primary_pos)
-            if _pos_visible:
-                _pos_ol.set_position(primary_pos)
-
-            secondary = {}
-            for name, info in AXIS_DEFINITIONS.items():
-                if name != self._active_axis:
-                    ca = info.get("controller_axis", "y")
-                    secondary[name] = state.mapped.get(ca, 50)
-            self.position_display.set_secondary_positions(secondary)
-            if _pos_visible:
-                _pos_ol.set_secondary_positions(secondary)
+
+        if panel_visible or pos_ol_visible:
+            if state.is_tracked and state.mapped:
+                mapped = state.mapped
+                primary_pos = mapped.get(self._primary_ctrl_axis, 50)
+                # Filled in place: the displays keep a reference and repaint from it
+                secondary = self._secondary_buf
+                for name, ca in self._secondary_layout:
+                    secondary[name] = mapped.get(ca, 50)
+                key = (True, primary_pos, tuple(secondary.values()))
+            else:
+                key = (state.is_tracked,)
+            if panel_visible and key != self._pos_panel_key:
+                self._pos_panel_key = key
+                self._push_position(panel, key)
+            if pos_ol_visible and key != self._pos_overlay_key:
+                self._pos_overlay_key = key
+                self._push_position(pos_ol, key)
 
         # Update 3D controller visualization
-        self.viz_panel.set_controller_state(
-            state.pitch, state.yaw, state.roll,
-            state.x, state.y, state.z, state.is_tracked
-        )
+        if self.viz_panel.isVisible():
+            self.viz_panel.set_controller_state(
+                state.pitch, state.yaw, state.roll,
+                state.x, state.y, state.z, state.is_tracked
+            )
         if self._viz_overlay and self._viz_overlay.isVisible():
             self._viz_overlay.set_controller_state(
                 state.pitch, state.yaw, state.roll,
                 state.x, state.y, state.z, state.is_tracked
             )
 
-        # Update recording buffer preview
-        if self._recording_active:
-            buf = self.recorder.get_buffer_preview()
-            axis_buf = buf.get(self._active_axis, [])
-            self.timeline.set_buffer_actions(axis_buf)
+    def _push_position(self, display, key: tuple):
+        """Apply a position key from _on_controller_state to one display."""
+        display.set_tracked(key[0])
+        if len(key) > 1:
+            display.set_position(key[1])
+            display.set_secondary_positions(self._secondary_buf)
 
-        # Update action count
+    def _on_project_changed(self):
+        """Update the action count after the project's actions changed."""
         total = self.project.get_total_actions()
         axis = self.project.get_axis(self._active_axis)
-        self._actions_label.setText(
-            f"Actions: {len(axis.actions)} ({total} total)")
+        text = f"Actions: {len(axis.actions)} ({total} total)"
+        if text != self._actions_label.text():
+            self._actions_label.setText(text)
 
-        # Backend label
-        backend = self.video_player.get_backend_name()
-        if not self._use_mouse_fallback and hasattr(self.controller, 'get_controller_name'):
-            input_mode = self.controller.get_controller_name()
-        elif not self._use_mouse_fallback:
-            input_mode = "VR"
-        else:
-            input_mode = "Mouse"
-        self._backend_label.setText(f"Video: {backend} | Input: {input_mode}")
+    def _update_buffer_preview(self):
+        """Recording tick: show the not-yet-committed take on the timeline."""
+        if self._recording_active and self.timeline.isVisible():
+            self.timeline.set_buffer_actions(
+                self.recorder.get_axis_preview(self._active_axis))
 
     def _refresh_timeline(self):
+        """
+        Schedule a timeline refresh. Requests made in the same event-loop
+        turn collapse into a single rebuild.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._do_refresh_timeline)
+
+    def _do_refresh_timeline(self):
         """
         Refresh timeline with current axis data + overlay lanes.
         Phase 3: populates primary lane + visible overlay lanes.
         """
+        self._refresh_pending = False
+
         # Primary lane (editable)
         axis = self.project.get_axis(self._active_axis)
-        self.timeline.set_actions(axis.actions)
+        self.timeline.set_actions(axis.actions, axis.revision)
 
-        # Overlay lanes for other axes
+        # Overlay lanes for other axes; only lanes whose data changed since
+        # the last push are sent, and lanes that went away are dropped
         overlay_lanes = {}
         overlay_vis = {}
+        overlay_rev = {}
+        cache = self._overlay_cache
         for ax_name in AXIS_DEFINITIONS:
-            if ax_name == self._active_axis:
-                continue
             other_axis = self.project.get_axis(ax_name)
-            if other_axis.actions:
-                overlay_lanes[ax_name] = other_axis.actions
-                overlay_vis[ax_name] = self._overlay_visible.get(ax_name, False)
-        self.timeline.set_overlay_lanes(overlay_lanes, overlay_vis)
+            if ax_name == self._active_axis or not other_axis.actions:
+                if cache.pop(ax_name, None) is not None:
+                    self.timeline.remove_overlay_lane(ax_name)
+                continue
+            actions = other_axis.actions
+            key = (id(actions), len(actions), other_axis.revision)
+            if cache.get(ax_name) == key:
+                continue
+            cache[ax_name] = key
+            overlay_lanes[ax_name] = actions
+            overlay_vis[ax_name] = self._overlay_visible.get(ax_name, False)
+            overlay_rev[ax_name] = other_axis.revision
+        if overlay_lanes:
+            self.timeline.set_overlay_lanes(overlay_lanes, overlay_vis, overlay_rev)
 
         # Beat analysis lane (Phase 5)
         if self._beat_data is not None:
             self.timeline.set_analysis_lane("beats", self._beat_data, True)
 
+        self._on_project_changed()
+
     # ================================================================
     #  FILE OPERATIONS
     # ================================================================
@@ -1217,6 +1422,9 @@ class MainWindow(QMainWindow):
         if path:
             try:
                 self.project, extra = FunscriptProject.load_project(path)
+                # Cached lane keys describe the old project's lists (whose ids
+                # may be reused); an empty key forces every lane to be resent
+                self._overlay_cache = dict.fromkeys(self._overlay_cache, ())
                 self.recorder = Recorder(self.project)
                 self._autosave_path = path
                 # Restore beat data if present
@@ -1303,14 +1511,8 @@ class MainWindow(QMainWindow):
         )
         if path:
             try:
-                import zipfile
-                import tempfile
-                with tempfile.TemporaryDirectory() as tmp_dir:
-                    exported = self.project.export_funscript(tmp_dir)
-                    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                        for fpath in exported:
-                            zf.write(fpath, os.path.basename(fpath))
-                names = ", ".join(os.path.basename(f) for f in exported)
+                exported = self.project.export_funscript_zip(path)
+                names = ", ".join(exported)
                 self._update_status(f"Bundle exported: {os.path.basename(path)} ({len(exported)} files)")
                 QMessageBox.information(
                     self, "Bundle Export Complete",
@@ -1337,7 +1539,7 @@ class MainWindow(QMainWindow):
             bd = self._beat_data
             beat_dict = {}
             if hasattr(bd, 'beats'):
-                beat_dict["beats"] = list(bd.beats) if bd.beats is not None else []
+                beat_dict["beats"] = [int(b) for b in bd.beats] if bd.beats is not None else []
             if hasattr(bd, 'bpm'):
                 beat_dict["bpm"] = bd.bpm
             if hasattr(bd, 'subdivisions'):
@@ -1352,6 +1554,7 @@ class MainWindow(QMainWindow):
         beat_dict = extra.get("beat_data")
         if beat_dict and HAS_BEAT_DETECTION:
             try:
+                from beat_detection import BeatData
                 bd = BeatData(
                     beats=beat_dict.get("beats", []),
                     bpm=beat_dict.get("bpm", beat_dict.get("tempo", 0.0)),
@@ -1406,6 +1609,13 @@ class MainWindow(QMainWindow):
     def _auto_calibrate(self):
         if self._calibrating:
             return
+        if self._cal_wizard is None:
+            # Calibration overlay (imported and built on first use)
+            from calibration_wizard import CalibrationWizard
+            self._cal_wizard = CalibrationWizard(self.controller, self.centralWidget())
+            self._cal_wizard.hide()
+            self._cal_wizard.calibration_finished.connect(self._apply_calibration)
+            self._cal_wizard.calibration_cancelled.connect(self._on_cal_cancelled)
         self._calibrating = True
         self._cal_wizard.start()
         self._update_status("Calibration wizard open -- follow the on-screen steps.")
@@ -1449,33 +1659,57 @@ class MainWindow(QMainWindow):
                 "Load a video first.")
             return
 
-        self._update_status("Detecting beats... (this may take a moment)")
-        QApplication.processEvents()
+        if self._beat_worker is not None:
+            self._update_status("Beat detection is already running.")
+            return
 
-        try:
-            bd = detect_beats(video_path)
-            if bd is None:
-                QMessageBox.warning(self, "Beat Detection",
-                    "Beat detection returned no results.\n"
-                    "Make sure ffmpeg is installed and the video has an audio track.")
-                self._update_status("Beat detection: no results.")
-                return
-            self._beat_data = bd
-            self.timeline.set_analysis_lane("beats", bd, True)
-            self._beats_visible_action.setEnabled(True)
-            self._beats_visible_action.setChecked(True)
-            n_beats = len(bd.beats) if bd.beats else 0
-            n_onsets = len(bd.onsets) if bd.onsets else 0
-            bpm_str = f"{bd.bpm:.1f} BPM" if bd.bpm else "unknown"
-            conf_str = f"{bd.confidence * 100:.0f}%" if bd.confidence else "?"
-            msg = f"Beat detection: {bpm_str} (confidence {conf_str}), {n_beats} beats, {n_onsets} onsets"
-            if bd.confidence < 0.2:
-                msg += " ⚠ Low confidence — audio may lack clear rhythm"
-            self._update_status(msg)
-        except Exception as e:
-            QMessageBox.warning(self, "Beat Detection Error",
-                f"Failed to detect beats:\n{e}")
-            self._update_status("Beat detection failed.")
+        self._update_status("Detecting beats... (this may take a moment)")
+        self._busy_bar.show()
+        self._detect_beats_action.setEnabled(False)
+
+        worker = _BeatWorker(video_path)
+        worker.signals.finished.connect(self._on_beats_ready,
+                                        Qt.ConnectionType.QueuedConnection)
+        worker.signals.failed.connect(self._on_beats_failed,
+                                      Qt.ConnectionType.QueuedConnection)
+        self._beat_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_beats_ready(self, bd):
+        """Called on the Qt thread when the beat worker finishes."""
+        worker, self._beat_worker = self._beat_worker, None
+        self._busy_bar.hide()
+        self._detect_beats_action.setEnabled(True)
+        if worker.video_path != self.video_player.get_video_path():
+            # A different video was loaded while detection ran
+            self._update_status("Beat detection discarded: video changed.")
+            return
+        if bd is None:
+            QMessageBox.warning(self, "Beat Detection",
+                "Beat detection returned no results.\n"
+                "Make sure ffmpeg is installed and the video has an audio track.")
+            self._update_status("Beat detection: no results.")
+            return
+        self._beat_data = bd
+        self.timeline.set_analysis_lane("beats", bd, True)
+        self._beats_visible_action.setEnabled(True)
+        self._beats_visible_action.setChecked(True)
+        n_beats = len(bd.beats) if bd.beats is not None else 0
+        n_onsets = len(bd.onsets) if bd.onsets is not None else 0
+        bpm_str = f"{bd.bpm:.1f} BPM" if bd.bpm else "unknown"
+        conf_str = f"{bd.confidence * 100:.0f}%" if bd.confidence else "?"
+        msg = f"Beat detection: {bpm_str} (confidence {conf_str}), {n_beats} beats, {n_onsets} onsets"
+        if bd.confidence < 0.2:
+            msg += " ⚠ Low confidence — audio may lack clear rhythm"
+        self._update_status(msg)
+
+    def _on_beats_failed(self, error: str):
+        self._beat_worker = None
+        self._busy_bar.hide()
+        self._detect_beats_action.setEnabled(True)
+        QMessageBox.warning(self, "Beat Detection Error",
+            f"Failed to detect beats:\n{error}")
+        self._update_status("Beat detection failed.")
 
     def _toggle_beats_visible(self, show: bool):
         if self._beat_data is not None:
@@ -1491,6 +1725,9 @@ class MainWindow(QMainWindow):
 
     def _on_beat_snap_changed(self, value: int):
         """Update the beat snap label when slider moves."""
+        self._defer_slider(self._show_beat_snap_value, value)
+
+    def _show_beat_snap_value(self, value: int):
         self.beat_snap_label.setText(f"{value}%")
 
     def _apply_beat_snap(self):
@@ -1518,15 +1755,10 @@ class MainWindow(QMainWindow):
             return
 
         beats = self._beat_data.beats
-        if not beats:
+        if beats is None or len(beats) == 0:
             self._update_status("No beats detected.")
             return
 
-        # Use beat grid (including subdivisions) for finer snapping
-        grid = self._beat_data.get_beat_grid()
-        if not grid:
-            grid = beats
-
         # Determine target range
         s1, s2 = self.timeline.get_selection()
         if s1 >= 0:
@@ -1540,20 +1772,17 @@ class MainWindow(QMainWindow):
 
         blend = strength / 100.0
         tolerance_ms = 60000.0 / max(1, self._beat_data.bpm) * 0.6  # ~60% of beat interval
-        snapped = 0
-
-        for action in target:
-            # Find nearest grid point
-            nearest = min(grid, key=lambda b: abs(b - action.at))
-            dist = abs(nearest - action.at)
 
-            if dist <= tolerance_ms:
-                # Lerp: blend between original and beat position
-                original_at = action.at
-                new_at = int(original_at + (nearest - original_at) * blend)
-                if new_at != original_at:
-                    action.at = new_at
-                    snapped += 1
+        # Nearest beat-grid point (including subdivisions) for every action
+        # at once, lerped by blend; only moved actions are written back
+        original = [a.at for a in target]
+        new_times = self._beat_data.snap_many(
+            original, tolerance_ms, use_grid=True, blend=blend).tolist()
+        snapped = 0
+        for action, original_at, new_at in zip(target, original, new_times):
+            if new_at != original_at:
+                action.at = new_at
+                snapped += 1
 
         axis.sort_actions()
         axis.remove_duplicates()
@@ -1584,9 +1813,8 @@ class MainWindow(QMainWindow):
         """Toggle the floating 3D viz overlay."""
         if self._viz_overlay and self._viz_overlay.isVisible():
             self._viz_overlay.hide()
-            self._viz_overlay_action.blockSignals(True)
-            self._viz_overlay_action.setChecked(False)
-            self._viz_overlay_action.blockSignals(False)
+            with QSignalBlocker(self._viz_overlay_action):
+                self._viz_overlay_action.setChecked(False)
             return
         if self._viz_overlay is None:
             self._viz_overlay = ControllerVizOverlay(self._video_area)
@@ -1597,9 +1825,9 @@ class MainWindow(QMainWindow):
         self._viz_overlay.move(video_global.x() + 10, video_global.y() + 10)
         self._viz_overlay.show()
         self._viz_overlay.raise_()
-        self._viz_overlay_action.blockSignals(True)
-        self._viz_overlay_action.setChecked(True)
-        self._viz_overlay_action.blockSignals(False)
+        self._on_controller_state()
+        with QSignalBlocker(self._viz_overlay_action):
+            self._viz_overlay_action.setChecked(True)
 
     def _toggle_viz_overlay(self, show: bool):
         if show:
@@ -1608,9 +1836,8 @@ class MainWindow(QMainWindow):
             self._viz_overlay.hide()
 
     def _on_viz_overlay_closed(self):
-        self._viz_overlay_action.blockSignals(True)
-        self._viz_overlay_action.setChecked(False)
-        self._viz_overlay_action.blockSignals(False)
+        with QSignalBlocker(self._viz_overlay_action):
+            self._viz_overlay_action.setChecked(False)
 
     # ================================================================
     #  POSITION DISPLAY OVERLAY
@@ -1620,9 +1847,8 @@ class MainWindow(QMainWindow):
         """Toggle the floating position bar overlay."""
         if self._pos_overlay and self._pos_overlay.isVisible():
             self._pos_overlay.hide()
-            self._pos_overlay_action.blockSignals(True)
-            self._pos_overlay_action.setChecked(False)
-            self._pos_overlay_action.blockSignals(False)
+            with QSignalBlocker(self._pos_overlay_action):
+                self._pos_overlay_action.setChecked(False)
             return
         if self._pos_overlay is None:
             self._pos_overlay = PositionDisplayOverlay(self._video_area)
@@ -1633,9 +1859,10 @@ class MainWindow(QMainWindow):
         self._pos_overlay.move(video_global.x() - 130, video_global.y() + 10)
         self._pos_overlay.show()
         self._pos_overlay.raise_()
-        self._pos_overlay_action.blockSignals(True)
-        self._pos_overlay_action.setChecked(True)
-        self._pos_overlay_action.blockSignals(False)
+        self._pos_overlay_key = None
+        self._on_controller_state()
+        with QSignalBlocker(self._pos_overlay_action):
+            self._pos_overlay_action.setChecked(True)
 
     def _toggle_pos_overlay(self, show: bool):
         if show:
@@ -1644,9 +1871,8 @@ class MainWindow(QMainWindow):
             self._pos_overlay.hide()
 
     def _on_pos_overlay_closed(self):
-        self._pos_overlay_action.blockSignals(True)
-        self._pos_overlay_action.setChecked(False)
-        self._pos_overlay_action.blockSignals(False)
+        with QSignalBlocker(self._pos_overlay_action):
+            self._pos_overlay_action.setChecked(False)
 
     # ================================================================
     #  HELP
@@ -1742,6 +1968,7 @@ META QUEST TOUCH (via Quest Link / Air Link):
     # ================================================================
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)  # the duration repeats on every tick
     def _format_time(ms: int) -> str:
         if ms < 0:
             ms = 0
@@ -1753,6 +1980,19 @@ META QUEST TOUCH (via Quest Link / Air Link):
     def _update_status(self, msg: str):
         self._status_label.setText(msg)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Updates are skipped while hidden or minimized; catch up on show
+        self._on_time_tick(self.video_player.get_time_ms())
+        self._pos_panel_key = None
+        self._on_controller_state()
+        if self._recording_active:
+            self._ui_timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._ui_timer.stop()
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         if self._calibrating and self._cal_wizard.isVisible():
@@ -1783,7 +2023,7 @@ META QUEST TOUCH (via Quest Link / Air Link):
             self._viz_overlay.close()
         if self._pos_overlay:
             self._pos_overlay.close()
-        if self._cal_wizard.isVisible():
+        if self._cal_wizard and self._cal_wizard.isVisible():
             self._cal_wizard.close()
 
         if self._autosave_path and self.project.get_total_actions() > 0:
@@ -13,7 +13,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QSlider, QSizeGrip, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QRectF, QPointF, QPoint, QSize, pyqtSignal
+from PyQt6.QtCore import Qt, QRectF, QPointF, QPoint, QSize, QTimer, pyqtSignal
 from PyQt6.QtGui import (QPainter, QPen, QColor, QBrush, QPainterPath,
                           QLinearGradient, QRadialGradient, QFont, QMouseEvent)
 
@@ -55,13 +55,26 @@ class _PositionCanvas(QWidget):
         self._secondary_positions: dict = {}
         self._alpha = 255  # For overlay transparency
 
+        # Positions only arrive when the controller moves; this keeps
+        # repainting until the newest trail dot has faded out
+        self._fade_timer = QTimer(self)
+        self._fade_timer.setInterval(33)
+        self._fade_timer.timeout.connect(self._on_fade_tick)
+
     def set_position(self, pos: int):
         self._position = max(0, min(100, pos))
         now = time.time()
         if now - self._last_trail_time > 0.016:
             self._trail.append((pos, now))
             self._last_trail_time = now
+        if not self._fade_timer.isActive():
+            self._fade_timer.start()
+        self.update()
+
+    def _on_fade_tick(self):
         self.update()
+        if not self._trail or time.time() - self._trail[-1][1] > 0.5:
+            self._fade_timer.stop()
 
     def set_secondary_positions(self, positions: dict):
         self._secondary_positions = positions
@@ -72,8 +85,9 @@ class _PositionCanvas(QWidget):
         self.update()
 
     def set_tracked(self, tracked: bool):
-        self._is_tracked = tracked
-        self.update()
+        if tracked != self._is_tracked:
+            self._is_tracked = tracked
+            self.update()
 
     def set_axis_label(self, label: str):
         self._axis_label = label
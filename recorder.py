@@ -6,6 +6,8 @@ Manages recording sessions, undo/redo, and data processing.
 
 import copy
 import time
+from array import array
+from itertools import accumulate
 from dataclasses import dataclass, field
 from typing import Optional
 from funscript_io import FunscriptAction, FunscriptAxis, FunscriptProject, AXIS_DEFINITIONS
@@ -83,8 +85,12 @@ class Recorder:
         self.active_axis: str = "stroke"  # Which axis to record to
         self.active_axes: set[str] = {"stroke"}  # Multi-axis recording
 
-        # Current recording buffer
-        self._buffer: dict[str, list[FunscriptAction]] = {}
+        # Current recording buffer: per axis, parallel typed arrays of
+        # timestamps and positions (no object per sample). FunscriptActions
+        # are built on demand, for the live preview and on stop.
+        self._buf_at: dict[str, array] = {}
+        self._buf_pos: dict[str, array] = {}
+        self._buf_actions: dict[str, list[FunscriptAction]] = {}
         self._record_start_ms: int = 0
 
         # Recording settings
@@ -100,7 +106,9 @@ class Recorder:
         """Begin a recording session."""
         self.is_recording = True
         self._record_start_ms = video_time_ms
-        self._buffer = {axis: [] for axis in self.active_axes}
+        self._buf_at = {axis: array('i') for axis in self.active_axes}
+        self._buf_pos = {axis: array('b') for axis in self.active_axes}
+        self._buf_actions = {axis: [] for axis in self.active_axes}
         self._last_sample_time = {axis: -1 for axis in self.active_axes}
 
     def stop_recording(self) -> dict[str, RecordingSegment]:
@@ -111,7 +119,8 @@ class Recorder:
         self.is_recording = False
         segments = {}
 
-        for axis_name, actions in self._buffer.items():
+        for axis_name in self._buf_at:
+            actions = self._axis_buffer_actions(axis_name)
             if not actions:
                 continue
 
@@ -137,50 +146,82 @@ class Recorder:
             self.undo_manager.push("record", segment, copy.deepcopy(previous))
             segments[axis_name] = segment
 
-        self._buffer.clear()
+        self._clear_buffer()
         return segments
 
     def cancel_recording(self):
         """Cancel current recording without saving."""
         self.is_recording = False
-        self._buffer.clear()
+        self._clear_buffer()
+
+    def _clear_buffer(self):
+        self._buf_at.clear()
+        self._buf_pos.clear()
+        self._buf_actions.clear()
 
     def add_sample(self, video_time_ms: int, mapped_positions: dict[str, int]):
         """
         Add a sample during recording.
         mapped_positions: dict of axis_name -> 0-100 value
         """
+        self.add_samples(((video_time_ms, mapped_positions),))
+
+    def add_samples(self, samples):
+        """
+        Add a batch of (video_time_ms, mapped_positions) samples in capture
+        order; same result as calling add_sample() for each one.
+        """
         if not self.is_recording:
             return
 
+        # Map funscript axis names (e.g. "stroke") to controller axes (e.g. "y")
+        # once per batch rather than per sample
+        routes = []
         for axis_name in self.active_axes:
-            # Map funscript axis name (e.g. "stroke") to controller axis (e.g. "y")
             axis_def = AXIS_DEFINITIONS.get(axis_name)
-            if axis_def:
-                controller_axis = axis_def["controller_axis"]
-            else:
-                controller_axis = axis_name
-
-            if controller_axis not in mapped_positions:
-                continue
-
-            pos = mapped_positions.get(controller_axis, 50)
-
-            # Enforce minimum interval
-            last_time = self._last_sample_time.get(axis_name, -1)
-            if last_time >= 0 and (video_time_ms - last_time) < self.min_interval_ms:
-                continue
-
-            action = FunscriptAction(at=video_time_ms, pos=max(0, min(100, pos)))
-
-            if axis_name not in self._buffer:
-                self._buffer[axis_name] = []
-            self._buffer[axis_name].append(action)
-            self._last_sample_time[axis_name] = video_time_ms
+            controller_axis = axis_def["controller_axis"] if axis_def else axis_name
+            routes.append((axis_name, controller_axis))
+
+        buf_at = self._buf_at
+        buf_pos = self._buf_pos
+        last_sample_time = self._last_sample_time
+        min_interval = self.min_interval_ms
+        for video_time_ms, mapped_positions in samples:
+            for axis_name, controller_axis in routes:
+                if controller_axis not in mapped_positions:
+                    continue
+
+                pos = mapped_positions[controller_axis]
+
+                # Enforce minimum interval
+                last_time = last_sample_time.get(axis_name, -1)
+                if last_time >= 0 and (video_time_ms - last_time) < min_interval:
+                    continue
+
+                if axis_name not in buf_at:
+                    buf_at[axis_name] = array('i')
+                    buf_pos[axis_name] = array('b')
+                buf_at[axis_name].append(video_time_ms)
+                buf_pos[axis_name].append(max(0, min(100, pos)))
+                last_sample_time[axis_name] = video_time_ms
+
+    def _axis_buffer_actions(self, axis_name: str) -> list[FunscriptAction]:
+        """Recorded actions for one axis; only new samples are converted."""
+        actions = self._buf_actions.setdefault(axis_name, [])
+        at = self._buf_at.get(axis_name)
+        if at is not None and len(actions) < len(at):
+            start = len(actions)
+            actions.extend(map(FunscriptAction, at[start:],
+                               self._buf_pos[axis_name][start:]))
+        return actions
+
+    def get_axis_preview(self, axis_name: str) -> list[FunscriptAction]:
+        """Get one axis of the current recording buffer for live preview."""
+        return self._axis_buffer_actions(axis_name)
 
     def get_buffer_preview(self) -> dict[str, list[FunscriptAction]]:
         """Get current recording buffer for live preview."""
-        return dict(self._buffer)
+        return {axis: self._axis_buffer_actions(axis) for axis in self._buf_at}
 
     def undo(self) -> bool:
         """Undo the last recording action."""
@@ -317,6 +358,7 @@ class Recorder:
 
         for action, new_pos in zip(target_actions, smoothed):
             action.pos = max(0, min(100, int(round(new_pos))))
+        axis.mark_dirty()
 
         segment = RecordingSegment(
             axis_name=axis_name,
@@ -328,11 +370,14 @@ class Recorder:
 
     @staticmethod
     def _moving_average(data: list[float], window: int) -> list[float]:
-        """Simple moving average."""
-        result = []
+        """Simple moving average (window shrinks at the ends)."""
+        # Prefix sums make each window O(1) instead of O(window)
+        sums = list(accumulate(data, initial=0))
+        n = len(data)
         half = window // 2
-        for i in range(len(data)):
+        result = []
+        for i in range(n):
             start = max(0, i - half)
-            end = min(len(data), i + half + 1)
-            result.append(sum(data[start:end]) / (end - start))
+            end = min(n, i + half + 1)
+            result.append((sums[end] - sums[start]) / (end - start))
         return result
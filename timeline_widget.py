@@ -8,11 +8,19 @@ Supports: zoom, pan, selection, click-to-seek, and direct point editing
 (click-drag points to adjust time and position).
 """
 
+from collections import OrderedDict
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 from PyQt6.QtWidgets import QWidget, QMenu
 from PyQt6.QtCore import Qt, QRectF, pyqtSignal, QPointF, QTimer
 from PyQt6.QtGui import (QPainter, QPen, QColor, QBrush, QPainterPath,
                           QLinearGradient, QMouseEvent, QWheelEvent,
-                          QContextMenuEvent, QFont)
+                          QContextMenuEvent, QFont, QPixmap)
 
 from funscript_io import FunscriptAction
 import copy
@@ -66,6 +74,9 @@ class TimelineWidget(QWidget):
     COLOR_BEAT = QColor(249, 226, 175, 200)         # yellow/gold - bright
     COLOR_BEAT_SUB = QColor(249, 226, 175, 80)       # subdivisions
 
+    # Overlay lanes plus the heatmap fit comfortably
+    GEOMETRY_CACHE_SIZE = 8
+
     # Hit-test radius in pixels
     POINT_HIT_RADIUS = 10
     POINT_DRAW_RADIUS = 4
@@ -123,7 +134,19 @@ class TimelineWidget(QWidget):
 
         # --- Multi-lane overlays (Phase 3) ---
         self._primary_axis_id: str = "stroke"
-        self._overlay_lanes: dict[str, dict] = {}  # {axis_id: {"actions": list, "visible": bool}}
+        self._overlay_lanes: dict[str, dict] = {}  # {axis_id: {"actions": list, "visible": bool, "revision": int|None}}
+        self._actions_revision = None  # FunscriptAxis.revision of _actions, if known
+
+        # Derived geometry (line paths, heatmap bars) keyed by data revision
+        # and view; LRU, newest last
+        self._geometry_cache: OrderedDict = OrderedDict()
+        # (at, pos) NumPy snapshots of revisioned action lists, same keying
+        self._arrays_cache: OrderedDict = OrderedDict()
+
+        # Static layers (grid, heatmap, selection, beats, lane lines) rendered
+        # once per change of _base_key(); points, playhead etc. go on top
+        self._base_pixmap = None
+        self._base_pixmap_key = None
 
         # --- Heatmap (Phase 4) ---
         self._show_heatmap: bool = False
@@ -133,9 +156,13 @@ class TimelineWidget(QWidget):
 
     # ---- Public API ----
 
-    def set_actions(self, actions: list[FunscriptAction]):
-        """Set the funscript actions to display (keeps reference). Backward-compat."""
+    def set_actions(self, actions: list[FunscriptAction], revision=None):
+        """
+        Set the funscript actions to display (keeps reference). Backward-compat.
+        revision is the owning axis' revision, enabling the heatmap cache.
+        """
         self._actions = actions
+        self._actions_revision = revision
         # Reset editing state when data reloads
         self._hover_idx = -1
         self._selected_idx = -1
@@ -145,25 +172,36 @@ class TimelineWidget(QWidget):
 
     # --- Multi-lane API (Phase 3) ---
 
-    def set_primary_lane(self, axis_id: str, actions: list):
+    def set_primary_lane(self, axis_id: str, actions: list, revision=None):
         """Set the primary (editable) lane."""
         self._primary_axis_id = axis_id
         self._actions = actions
+        self._actions_revision = revision
         self._hover_idx = -1
         self._selected_idx = -1
         self._dragging_idx = -1
         self._is_dragging = False
         self.update()
 
-    def set_overlay_lanes(self, lanes: dict, visibility: dict | None = None):
-        """Set overlay lanes: {axis_id: actions_list}."""
+    def set_overlay_lanes(self, lanes: dict, visibility: dict | None = None,
+                          revisions: dict | None = None):
+        """
+        Set overlay lanes: {axis_id: actions_list}. revisions maps axis_id to
+        the owning axis' revision; lanes with one get their paths cached.
+        """
         for axis_id, actions in lanes.items():
             self._overlay_lanes[axis_id] = {
                 "actions": actions,
                 "visible": visibility.get(axis_id, True) if visibility else True,
+                "revision": revisions.get(axis_id) if revisions else None,
             }
         self.update()
 
+    def remove_overlay_lane(self, axis_id: str):
+        """Drop an overlay lane (its axis became primary or has no actions)."""
+        if self._overlay_lanes.pop(axis_id, None) is not None:
+            self.update()
+
     def set_overlay_visibility(self, axis_id: str, visible: bool):
         """Toggle a single overlay lane on/off."""
         if axis_id in self._overlay_lanes:
@@ -307,7 +345,67 @@ class TimelineWidget(QWidget):
     # ---- Painting ----
 
     def paintEvent(self, event):
+        key = self._base_key()
+        if self._base_pixmap is None or key is None or key != self._base_pixmap_key:
+            self._base_pixmap = self._render_base()
+            self._base_pixmap_key = key
+
         p = QPainter(self)
+        p.drawPixmap(0, 0, self._base_pixmap)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = self._get_plot_rect()
+
+        # Interactive layer: points (hover/select state), live buffer,
+        # playhead and tooltip change without touching the base layer
+        if self._actions:
+            self._draw_action_points(p, rect, self._actions)
+
+        # Live recording buffer
+        if self._buffer_actions:
+            self._draw_actions_line(p, rect, self._buffer_actions, self.COLOR_BUFFER_LINE, self.COLOR_RECORDING)
+
+        # Playhead
+        self._draw_playhead(p, rect)
+
+        # Tooltip overlay for hovered/selected point
+        self._draw_point_tooltip(p, rect)
+
+        p.end()
+
+    def _base_key(self):
+        """
+        Everything the cached base layer depends on, or None when it cannot
+        be trusted (a point is being dragged in place, or lane data has no
+        revision to tell edits apart).
+        """
+        if self._is_dragging:
+            return None
+        if self._actions and self._actions_revision is None:
+            return None
+        lanes = []
+        for axis_id, lane in self._overlay_lanes.items():
+            if lane.get("visible") and lane.get("actions"):
+                if lane.get("revision") is None:
+                    return None
+                lanes.append((axis_id, id(lane["actions"]),
+                              len(lane["actions"]), lane["revision"]))
+        analysis = tuple((lane_id, id(lane.get("data")), lane.get("visible"))
+                         for lane_id, lane in self._analysis_lanes.items())
+        return (self.width(), self.height(), self.devicePixelRatioF(),
+                self._view_start_ms, self._view_end_ms,
+                self._selection_start_ms, self._selection_end_ms,
+                self._show_heatmap,
+                id(self._actions), len(self._actions), self._actions_revision,
+                tuple(lanes), analysis,
+                # The recording marker follows the playhead
+                self._playhead_ms if self._is_recording else None)
+
+    def _render_base(self) -> QPixmap:
+        """Paint the layers that only change with data, view or selection."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        p = QPainter(pixmap)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
         rect = self._get_plot_rect()
 
@@ -339,24 +437,19 @@ class TimelineWidget(QWidget):
             if lane.get("visible") and lane.get("actions"):
                 color = self.OVERLAY_COLORS.get(axis_id, QColor(180, 180, 180, 70))
                 fill = QColor(color.red(), color.green(), color.blue(), 20)
-                self._draw_actions_line(p, rect, lane["actions"], color, fill)
+                revision = lane.get("revision")
+                self._draw_actions_line(
+                    p, rect, lane["actions"], color, fill,
+                    cache_id=(axis_id, revision) if revision is not None else None,
+                    revision=revision)
 
-        # Committed action data (primary lane: line + fill + points)
+        # Committed action data (primary lane: line + fill; points are live)
         if self._actions:
-            self._draw_actions_line(p, rect, self._actions, self.COLOR_LINE, self.COLOR_LINE_FILL)
-            self._draw_action_points(p, rect, self._actions)
-
-        # Live recording buffer
-        if self._buffer_actions:
-            self._draw_actions_line(p, rect, self._buffer_actions, self.COLOR_BUFFER_LINE, self.COLOR_RECORDING)
-
-        # Playhead
-        self._draw_playhead(p, rect)
-
-        # Tooltip overlay for hovered/selected point
-        self._draw_point_tooltip(p, rect)
+            self._draw_actions_line(p, rect, self._actions, self.COLOR_LINE, self.COLOR_LINE_FILL,
+                                    revision=self._stable_revision())
 
         p.end()
+        return pixmap
 
     def _draw_grid(self, p: QPainter, rect: QRectF):
         """Draw time and position grid lines."""
@@ -404,41 +497,114 @@ class TimelineWidget(QWidget):
                 p.setPen(pen)
             t += interval
 
+    def _cached_geometry(self, cache_id, actions, rect: QRectF, build):
+        """
+        Return build() memoized on cache_id (a data revision), the list
+        identity/length and the current view; cache_id None disables caching.
+        """
+        if cache_id is None:
+            return build()
+        key = (cache_id, id(actions), len(actions),
+               self._view_start_ms, self._view_end_ms,
+               rect.x(), rect.y(), rect.width(), rect.height())
+        cache = self._geometry_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        result = build()
+        cache[key] = result
+        if len(cache) > self.GEOMETRY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
+    def _stable_revision(self):
+        """Revision of _actions, or None while a drag edits them in place."""
+        return None if self._is_dragging else self._actions_revision
+
+    def _action_arrays(self, actions: list[FunscriptAction], revision):
+        """
+        (at float64, pos float64) arrays for a revisioned, sorted action
+        list, built once per revision; None without NumPy or a revision.
+        """
+        if not HAS_NUMPY or revision is None:
+            return None
+        key = (revision, id(actions), len(actions))
+        cache = self._arrays_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        n = len(actions)
+        arrays = (np.fromiter((a.at for a in actions), dtype=np.float64, count=n),
+                  np.fromiter((a.pos for a in actions), dtype=np.float64, count=n))
+        cache[key] = arrays
+        if len(cache) > self.GEOMETRY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return arrays
+
     def _draw_actions_line(self, p: QPainter, rect: QRectF,
                            actions: list[FunscriptAction],
-                           line_color: QColor, fill_color: QColor):
-        """Draw action data as a filled line graph (no points - those are separate)."""
-        visible = [a for a in actions
-                    if self._view_start_ms - 1000 <= a.at <= self._view_end_ms + 1000]
-        if not visible:
+                           line_color: QColor, fill_color: QColor,
+                           cache_id=None, revision=None):
+        """
+        Draw action data as a filled line graph (no points - those are separate).
+        cache_id identifies an unchanged data revision whose paths may be reused;
+        revision lets path building window the data with NumPy.
+        """
+        paths = self._cached_geometry(
+            cache_id, actions, rect,
+            lambda: self._build_line_paths(rect, actions, revision))
+        if paths is None:
             return
+        path, fill_path = paths
+
+        p.setPen(Qt.PenStyle.NoPen)
+        p.setBrush(QBrush(fill_color))
+        p.drawPath(fill_path)
+
+        p.setBrush(Qt.BrushStyle.NoBrush)
+        p.setPen(QPen(line_color, 2))
+        p.drawPath(path)
+
+    def _visible_points(self, rect: QRectF, actions: list[FunscriptAction],
+                        revision) -> list:
+        """[(x, y)] for actions within a second of the view."""
+        lo_ms = self._view_start_ms - 1000
+        hi_ms = self._view_end_ms + 1000
+        arrays = self._action_arrays(actions, revision)
+        if arrays is None:
+            return [(self._ms_to_x(a.at), self._pos_to_y(a.pos))
+                    for a in actions if lo_ms <= a.at <= hi_ms]
+        at, pos = arrays
+        lo = np.searchsorted(at, lo_ms, side="left")
+        hi = np.searchsorted(at, hi_ms, side="right")
+        view_range = max(1, self._view_end_ms - self._view_start_ms)
+        xs = rect.left() + (at[lo:hi] - self._view_start_ms) / view_range * rect.width()
+        ys = rect.bottom() - (pos[lo:hi] / 100.0) * rect.height()
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def _build_line_paths(self, rect: QRectF, actions: list[FunscriptAction],
+                          revision=None):
+        """(line path, fill path) for the actions in view, or None."""
+        points = self._visible_points(rect, actions, revision)
+        if not points:
+            return None
 
         path = QPainterPath()
         fill_path = QPainterPath()
 
-        first_x = self._ms_to_x(visible[0].at)
-        first_y = self._pos_to_y(visible[0].pos)
+        first_x, first_y = points[0]
         path.moveTo(first_x, first_y)
         fill_path.moveTo(first_x, rect.bottom())
         fill_path.lineTo(first_x, first_y)
 
-        for action in visible[1:]:
-            x = self._ms_to_x(action.at)
-            y = self._pos_to_y(action.pos)
+        for x, y in points[1:]:
             path.lineTo(x, y)
             fill_path.lineTo(x, y)
 
-        last_x = self._ms_to_x(visible[-1].at)
+        last_x = points[-1][0]
         fill_path.lineTo(last_x, rect.bottom())
         fill_path.closeSubpath()
-
-        p.setPen(Qt.PenStyle.NoPen)
-        p.setBrush(QBrush(fill_color))
-        p.drawPath(fill_path)
-
-        p.setBrush(Qt.BrushStyle.NoBrush)
-        p.setPen(QPen(line_color, 2))
-        p.drawPath(path)
+        return path, fill_path
 
     def _draw_action_points(self, p: QPainter, rect: QRectF,
                             actions: list[FunscriptAction]):
@@ -572,24 +738,48 @@ class TimelineWidget(QWidget):
         """Draw time-density heatmap behind the primary data."""
         if not self._actions:
             return
+        # A dragged point is edited in place, so only cache between edits
+        revision = self._stable_revision()
+        cache_id = ("heatmap", revision) if revision is not None else None
+        bars = self._cached_geometry(
+            cache_id, self._actions, rect,
+            lambda: self._build_heatmap_bars(rect, revision))
+
+        p.setPen(Qt.PenStyle.NoPen)
+        for bar, color in bars:
+            p.setBrush(QBrush(color))
+            p.drawRect(bar)
+
+    def _build_heatmap_bars(self, rect: QRectF, revision=None) -> list:
+        """[(QRectF, QColor)] density bars for the primary actions in view."""
         # Aim for ~8px wide buckets for a clear visual
         bucket_w = max(4, int(rect.width() / 120))
         n_buckets = max(1, int(rect.width() / bucket_w))
-        buckets = [0] * n_buckets
         view_range = max(1, self._view_end_ms - self._view_start_ms)
 
-        for a in self._actions:
-            if a.at < self._view_start_ms or a.at > self._view_end_ms:
-                continue
-            frac = (a.at - self._view_start_ms) / view_range
-            bi = min(n_buckets - 1, int(frac * n_buckets))
-            buckets[bi] += 1
+        arrays = self._action_arrays(self._actions, revision)
+        if arrays is not None:
+            at = arrays[0]
+            lo = np.searchsorted(at, self._view_start_ms, side="left")
+            hi = np.searchsorted(at, self._view_end_ms, side="right")
+            bi = ((at[lo:hi] - self._view_start_ms) / view_range
+                  * n_buckets).astype(np.intp)
+            np.minimum(bi, n_buckets - 1, out=bi)
+            buckets = np.bincount(bi, minlength=n_buckets).tolist()
+        else:
+            buckets = [0] * n_buckets
+            for a in self._actions:
+                if a.at < self._view_start_ms or a.at > self._view_end_ms:
+                    continue
+                frac = (a.at - self._view_start_ms) / view_range
+                bi = min(n_buckets - 1, int(frac * n_buckets))
+                buckets[bi] += 1
 
         max_count = max(buckets) if buckets else 1
         if max_count == 0:
-            return
+            return []
 
-        p.setPen(Qt.PenStyle.NoPen)
+        bars = []
         for i, count in enumerate(buckets):
             if count == 0:
                 continue
@@ -606,16 +796,18 @@ class TimelineWidget(QWidget):
                 g = int(70 + (179 - 70) * t)
                 b = int(180 + (135 - 180) * t)
             alpha = int(60 + 140 * intensity)
-            color = QColor(r, g, b, alpha)
-            p.setBrush(QBrush(color))
             bx = rect.left() + i * bucket_w
-            p.drawRect(QRectF(bx, rect.top(), bucket_w, rect.height()))
+            bars.append((QRectF(bx, rect.top(), bucket_w, rect.height()),
+                         QColor(r, g, b, alpha)))
+        return bars
 
     def _draw_beat_markers(self, p: QPainter, rect: QRectF, beat_data):
         """Draw beat markers as top/bottom ticks so they don't obscure the waveform."""
         # Get beat timestamps
         if hasattr(beat_data, 'beats'):
-            beats = beat_data.beats or []
+            beats = beat_data.beats if beat_data.beats is not None else []
+            if hasattr(beats, 'tolist'):
+                beats = beats.tolist()  # NumPy array -> plain ints for drawing
         elif isinstance(beat_data, dict):
             beats = beat_data.get('beats', [])
         else:
@@ -835,7 +1027,6 @@ class TimelineWidget(QWidget):
                 if (new_action.at != self._drag_start_action.at or
                         new_action.pos != self._drag_start_action.pos):
                     self.point_moved.emit(idx, new_action.at, new_action.pos)
-                    self.points_modified.emit()
             self._is_dragging = False
             self._dragging_idx = -1
             self._drag_start_action = None
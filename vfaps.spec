@@ -1,9 +1,9 @@
 # -*- mode: python ; coding: utf-8 -*-
 from PyInstaller.utils.hooks import collect_all
 
-datas = []
+datas = [('dark.qss', '.')]
 binaries = []
-hiddenimports = ['main_window', 'video_player', 'vr_controller', 'recorder', 'timeline_widget', 'position_display', 'calibration_wizard', 'controller_viz', 'funscript_io', 'beat_detection', 'stabilization', 'vision_tracking', 'json', 'copy', 'math', 'threading', 'time', 'numpy', 'PyQt6.QtWidgets', 'PyQt6.QtCore', 'PyQt6.QtGui', 'PyQt6.sip']
+hiddenimports = ['main_window', 'axis_toggle', 'video_player', 'vr_controller', 'recorder', 'timeline_widget', 'position_display', 'calibration_wizard', 'controller_viz', 'funscript_io', 'beat_detection', 'stabilization', 'vision_tracking', 'json', 'copy', 'math', 'threading', 'time', 'numpy', 'PyQt6.QtWidgets', 'PyQt6.QtCore', 'PyQt6.QtGui', 'PyQt6.sip']
 tmp_ret = collect_all('openvr')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 
@@ -8,6 +8,7 @@ Falls back to QMediaPlayer if mpv is not available.
 import os
 import sys
 import time
+from typing import Optional
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QUrl
 from PyQt6.QtGui import QColor
@@ -37,6 +38,8 @@ class VideoPlayerWidget(QWidget):
     duration_changed = pyqtSignal(int)    # Total duration in ms
     state_changed = pyqtSignal(str)       # "playing", "paused", "stopped"
     video_loaded = pyqtSignal(str)        # Video file path
+    seeked = pyqtSignal()                 # Backend finished the last seek
+    _seek_done = pyqtSignal()             # mpv event thread -> Qt thread
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -58,6 +61,16 @@ class VideoPlayerWidget(QWidget):
         # while mpv is still processing a seek command
         self._seek_grace_until: float = 0.0
 
+        # Only one backend seek runs at a time; targets requested meanwhile
+        # collapse into the latest, sent when the running seek completes
+        self._seek_in_flight: bool = False
+        self._pending_seek_ms: Optional[int] = None
+        self._seek_timeout = QTimer(self)
+        self._seek_timeout.setSingleShot(True)
+        self._seek_timeout.setInterval(250)  # never wait forever on mpv
+        self._seek_timeout.timeout.connect(self._finish_seek)
+        self._seek_done.connect(self._finish_seek)
+
         # Layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -134,6 +147,11 @@ class VideoPlayerWidget(QWidget):
             self._is_playing = not value
             self.state_changed.emit("paused" if value else "playing")
 
+        # Decoding resumes after every seek
+        @self._mpv_player.event_callback('playback-restart')
+        def on_playback_restart(event):
+            self._seek_done.emit()
+
     def _init_qt_media(self):
         """Initialize Qt multimedia backend."""
         container_layout = QVBoxLayout(self._container)
@@ -187,6 +205,10 @@ class VideoPlayerWidget(QWidget):
             return
 
         self._video_path = path
+        # A seek queued for the previous file must not land in this one
+        self._seek_timeout.stop()
+        self._seek_in_flight = False
+        self._pending_seek_ms = None
 
         if self._backend == "mpv" and self._mpv_player:
             self._mpv_player.play(path)
@@ -227,17 +249,42 @@ class VideoPlayerWidget(QWidget):
         time_ms = max(0, min(self._duration_ms, time_ms))
         self._current_time_ms = time_ms
 
+        if self._seek_in_flight:
+            # mpv is still decoding toward the previous target; restarting
+            # it now would throw that work away, so keep only the latest
+            self._pending_seek_ms = time_ms
+        else:
+            self._dispatch_seek(time_ms)
+
+        # Immediately emit so timeline/slider update right now
+        self.time_changed.emit(time_ms)
+
+    def _dispatch_seek(self, time_ms: int):
+        """Send one seek to the backend."""
         # Set a grace period - the poll should not override our position
         # until mpv has actually caught up to the seek target
         self._seek_grace_until = time.time() + 0.15  # 150ms grace
 
         if self._backend == "mpv" and self._mpv_player:
+            self._seek_in_flight = True
+            self._seek_timeout.start()
             self._mpv_player.seek(time_ms / 1000.0, reference='absolute')
         elif self._backend == "qt" and self._qt_player:
+            # QMediaPlayer already replaces a running seek with a new one
             self._qt_player.setPosition(time_ms)
+            self.seeked.emit()
 
-        # Immediately emit so timeline/slider update right now
-        self.time_changed.emit(time_ms)
+    def _finish_seek(self):
+        """The running seek completed (or timed out): send the next one."""
+        if not self._seek_in_flight:
+            return
+        self._seek_timeout.stop()
+        self._seek_in_flight = False
+        pending, self._pending_seek_ms = self._pending_seek_ms, None
+        if pending is not None:
+            self._dispatch_seek(pending)
+        else:
+            self.seeked.emit()
 
     def seek_relative(self, delta_ms: int):
         """Seek relative to current position."""
@@ -277,6 +324,10 @@ class VideoPlayerWidget(QWidget):
         """Get current playback time in milliseconds."""
         return self._current_time_ms
 
+    def get_speed(self) -> float:
+        """Get the current playback speed multiplier."""
+        return self._playback_speed
+
     def get_duration_ms(self) -> int:
         """Get total video duration in milliseconds."""
         return self._duration_ms
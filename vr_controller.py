@@ -745,6 +745,9 @@ class MouseFallbackInput:
         self._poll_thread = None
         self._history = deque(maxlen=50)
         self.sensitivity = 1.0  # Default sensitivity
+        # Last built ControllerState; replaced (never mutated) when the mouse
+        # position changes, so callers may keep references to it
+        self._state = None
 
     def initialize(self) -> tuple[bool, str]:
         return True, "Mouse fallback mode active. Move mouse vertically in video area to control position."
@@ -770,12 +773,18 @@ class MouseFallbackInput:
             sx = max(0.0, min(1.0, sx))
             sy = max(0.0, min(1.0, sy))
 
-            self._current_x = int(sx * 100)
-            self._current_y = int((1.0 - sy) * 100)  # Invert Y for UI logic (up=100)
+            current_x = int(sx * 100)
+            current_y = int((1.0 - sy) * 100)  # Invert Y for UI logic (up=100)
+            if current_x != self._current_x or current_y != self._current_y:
+                self._current_x = current_x
+                self._current_y = current_y
+                self._state = None
 
     def get_current_state(self) -> ControllerState:
         with self._state_lock:
-            state = ControllerState(
+            if self._state is not None:
+                return self._state
+            state = self._state = ControllerState(
                 y=self._current_y / 100.0,
                 x=self._current_x / 100.0,
                 timestamp=time.time(),